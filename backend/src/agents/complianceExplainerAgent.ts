@@ -2,6 +2,30 @@ import llmProvider from '../utils/llmProvider';
 import ruleEngine from '../utils/ruleEngine';
 import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
 import logger from '../utils/logger';
+import { formatProfileLines } from '../utils/promptContext';
+import KeywordMatcher from '../utils/keywordMatcher';
+import ResponseCache from '../utils/responseCache';
+import { formatINR } from '../utils/format';
+
+// A term found in the user message: either a known compliance ID (or its spaced form)
+// or a generic search keyword. Lower priority wins when several appear.
+interface ComplianceTerm {
+  complianceId?: string;
+  searchKeyword?: string;
+  priority: number;
+}
+
+const COMPLIANCE_IDS = ['GST', 'FSSAI', 'UDYAM', 'TRADE_MARK', 'KA_SHOPS_ACT', 'MH_SHOPS_ACT', 'KA_TRADE_LICENSE'];
+const SEARCH_KEYWORDS = ['gst', 'fssai', 'license', 'registration', 'shops', 'trade'];
+
+// One automaton for both lookups, so each message is scanned once
+const COMPLIANCE_TERMS = new KeywordMatcher<ComplianceTerm>([
+  ...COMPLIANCE_IDS.flatMap((id, priority): Array<[string, ComplianceTerm]> => [
+    [id, { complianceId: id, priority }],
+    [id.replace('_', ' '), { complianceId: id, priority }]
+  ]),
+  ...SEARCH_KEYWORDS.map((keyword, priority): [string, ComplianceTerm] => [keyword, { searchKeyword: keyword, priority }])
+]);
 
 /**
  * Compliance Explainer Agent
@@ -35,10 +59,17 @@ Structure your explanation:
 5. Penalties for non-compliance (if any)
 6. Where to get it done`;
 
+  // The prompt holds the question, rule data and profile, so repeated questions reuse the explanation
+  private explanationCache = new ResponseCache<string>(500);
+
   async process(userMessage: string, context: ChatContext): Promise<AgentResponse> {
     try {
+      const terms = COMPLIANCE_TERMS.findAll(userMessage)
+        .map(match => match.value)
+        .sort((a, b) => a.priority - b.priority);
+
       // Extract compliance name/ID from message
-      const complianceId = this.extractComplianceReference(userMessage);
+      const complianceId = this.extractComplianceReference(terms);
       
       let complianceRule;
       if (complianceId) {
@@ -47,14 +78,15 @@ Structure your explanation:
 
       // If no specific compliance, search by keyword
       if (!complianceRule) {
-        const keywords = ['gst', 'fssai', 'license', 'registration', 'shops', 'trade'];
-        for (const keyword of keywords) {
-          if (userMessage.toLowerCase().includes(keyword)) {
-            const results = ruleEngine.searchRules(keyword);
-            if (results.length > 0) {
-              complianceRule = results[0];
-              break;
-            }
+        const seen = new Set<string>();
+        for (const { searchKeyword } of terms) {
+          if (!searchKeyword || seen.has(searchKeyword)) continue;
+          seen.add(searchKeyword);
+
+          const results = ruleEngine.searchRules(searchKeyword);
+          if (results.length > 0) {
+            complianceRule = results[0];
+            break;
           }
         }
       }
@@ -69,20 +101,25 @@ Structure your explanation:
       }
 
       const prompt = this.buildPrompt(userMessage, complianceRule, context);
-      
-      const response = await llmProvider.generateText(
-        prompt,
-        this.SYSTEM_PROMPT,
-        { temperature: 0.5, max_tokens: 1000 }
-      );
 
-      logger.info('Compliance Explainer generated explanation', {
+      let explanation = this.explanationCache.get(prompt);
+      if (explanation === undefined) {
+        const response = await llmProvider.generateText(
+          prompt,
+          this.SYSTEM_PROMPT,
+          { temperature: 0.5, max_tokens: 1000 }
+        );
+        explanation = response.content;
+        this.explanationCache.set(prompt, explanation);
+      }
+
+      logger.debug('Compliance Explainer generated explanation', {
         userId: context.user_id,
         complianceId: complianceRule.id
       });
 
       // Add disclaimer
-      const finalMessage = response.content + '\n\n*This is guidance based on public information and is not a substitute for professional legal advice.*';
+      const finalMessage = explanation + '\n\n*This is guidance based on public information and is not a substitute for professional legal advice.*';
 
       return {
         message: finalMessage,
@@ -103,7 +140,7 @@ Structure your explanation:
   }
 
   private buildPrompt(userMessage: string, complianceRule: any, context: ChatContext): string {
-    let prompt = `User Question: "${userMessage}"\n\n`;
+    let prompt = `Explain the compliance below to the user in simple terms, focusing on why it applies to their business and what they need to do. Use the official information provided and answer the user question at the end.\n\n`;
 
     prompt += `Official Compliance Information:\n`;
     prompt += `Name: ${complianceRule.name}\n`;
@@ -112,7 +149,7 @@ Structure your explanation:
     prompt += `Description: ${complianceRule.description}\n`;
     prompt += `Authority: ${complianceRule.authority}\n`;
     prompt += `Timeline: ${complianceRule.estimated_timeline}\n`;
-    prompt += `Cost: ₹${complianceRule.estimated_cost.min} - ₹${complianceRule.estimated_cost.max}\n`;
+    prompt += `Cost: ${formatINR(complianceRule.estimated_cost.min)} - ${formatINR(complianceRule.estimated_cost.max)}\n`;
     
     if (complianceRule.penalty) {
       prompt += `Penalty: ${complianceRule.penalty}\n`;
@@ -136,32 +173,21 @@ Structure your explanation:
     // Add business context
     if (context.business_profile) {
       prompt += `User's Business Context:\n`;
-      const profile = context.business_profile;
-      if (profile.business_type) prompt += `- Type: ${profile.business_type}\n`;
-      if (profile.state) prompt += `- Location: ${profile.city}, ${profile.state}\n`;
-      if (profile.annual_turnover) prompt += `- Turnover: ₹${profile.annual_turnover}\n`;
-      if (profile.sells_food) prompt += `- Sells Food: Yes\n`;
+      prompt += formatProfileLines(context.business_profile, ['business_type', 'location', 'annual_turnover', 'sells_food']);
       prompt += '\n';
     }
 
-    prompt += `Explain this compliance to the user in simple terms, focusing on why it applies to their business and what they need to do. Use the official information provided above.`;
+    prompt += `User Question: "${userMessage}"`;
 
     return prompt;
   }
 
-  private extractComplianceReference(message: string): string | null {
-    const upperMessage = message.toUpperCase();
-    
-    // Common compliance IDs
-    const complianceIds = ['GST', 'FSSAI', 'UDYAM', 'TRADE_MARK', 'KA_SHOPS_ACT', 'MH_SHOPS_ACT', 'KA_TRADE_LICENSE'];
-    
-    for (const id of complianceIds) {
-      if (upperMessage.includes(id) || upperMessage.includes(id.replace('_', ' '))) {
-        return id;
-      }
-    }
-
-    return null;
+  /**
+   * Pick the highest-priority compliance ID among the terms found in the message
+   */
+  private extractComplianceReference(terms: ComplianceTerm[]): string | null {
+    const idTerm = terms.find(term => term.complianceId);
+    return idTerm?.complianceId ?? null;
   }
 }
 
@@ -1,6 +1,30 @@
 import ruleEngine from '../utils/ruleEngine';
-import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
+import { AgentResponse, AgentType, Intent, ChatContext, ComplianceRule } from '../types';
 import logger from '../utils/logger';
+import { formatINR } from '../utils/format';
+import ResponseCache from '../utils/responseCache';
+
+// Static sections of the breakdown that do not depend on the compliances
+const ADDITIONAL_CONSIDERATIONS = `**📌 Additional Considerations:**
+- Professional fees (CA/Lawyer) may add 20-50% to the above
+- Some compliances require annual renewal fees
+- Document preparation costs not included
+- Platform commissions are separate from compliance costs
+
+`;
+const MONEY_SAVING_TIPS = `**💡 Money-Saving Tips:**
+- Apply for Udyam Registration (free) to access MSME benefits
+- Many registrations can be done online without intermediaries
+- Prepare documents in advance to avoid delays
+- Check for state-specific subsidies for new businesses
+
+Would you like detailed steps for any specific compliance or help with cost planning?`;
+
+interface CostBreakdown {
+  message: string;
+  totalCost: { min: number; max: number; currency: string };
+  penaltyCount: number;
+}
 
 /**
  * Cost & Risk Agent
@@ -11,6 +35,9 @@ import logger from '../utils/logger';
  * - NO scare tactics, just factual information
  */
 class CostRiskAgent {
+  // The breakdown is fully determined by the set of applicable compliances
+  private breakdownCache = new ResponseCache<CostBreakdown>(200);
+
   async process(userMessage: string, context: ChatContext): Promise<AgentResponse> {
     try {
       if (!context.business_profile) {
@@ -22,7 +49,7 @@ class CostRiskAgent {
         };
       }
 
-      logger.info('Calculating costs and risks', { 
+      logger.debug('Calculating costs and risks', { 
         userId: context.user_id,
         profileId: context.business_profile.id 
       });
@@ -39,69 +66,7 @@ class CostRiskAgent {
         };
       }
 
-      // Calculate total cost
-      const totalCost = ruleEngine.calculateTotalCost(compliances);
-      
-      // Build detailed cost breakdown
-      let message = `💰 **Cost & Fee Breakdown**\n\n`;
-      message += `Based on your business profile, here's the estimated cost breakdown:\n\n`;
-
-      // Detailed breakdown by compliance
-      message += `**📋 Compliance-wise Costs:**\n\n`;
-      
-      let tableData: string[] = [];
-      compliances.forEach(comp => {
-        const minCost = comp.estimated_cost.min;
-        const maxCost = comp.estimated_cost.max;
-        const mandatory = comp.mandatory ? '✅ Mandatory' : '⭐ Recommended';
-        
-        message += `**${comp.name}** (${mandatory})\n`;
-        message += `- Cost: ₹${minCost.toLocaleString('en-IN')}`;
-        if (minCost !== maxCost) {
-          message += ` - ₹${maxCost.toLocaleString('en-IN')}`;
-        }
-        message += `\n`;
-        message += `- Timeline: ${comp.estimated_timeline}\n`;
-        
-        if (comp.penalty) {
-          message += `- ⚠️ Non-compliance penalty: ${comp.penalty}\n`;
-        }
-        
-        message += `\n`;
-      });
-
-      // Total summary
-      message += `---\n\n`;
-      message += `**📊 Total Estimated Costs:**\n`;
-      message += `- Minimum: ₹${totalCost.min.toLocaleString('en-IN')}\n`;
-      message += `- Maximum: ₹${totalCost.max.toLocaleString('en-IN')}\n\n`;
-
-      // Additional costs
-      message += `**📌 Additional Considerations:**\n`;
-      message += `- Professional fees (CA/Lawyer) may add 20-50% to the above\n`;
-      message += `- Some compliances require annual renewal fees\n`;
-      message += `- Document preparation costs not included\n`;
-      message += `- Platform commissions are separate from compliance costs\n\n`;
-
-      // Penalty summary
-      const compliancesWithPenalties = compliances.filter(c => c.penalty);
-      if (compliancesWithPenalties.length > 0) {
-        message += `**⚠️ Penalty Summary:**\n`;
-        message += `_Operating without proper compliances may result in:_\n`;
-        compliancesWithPenalties.forEach(comp => {
-          message += `- ${comp.name}: ${comp.penalty}\n`;
-        });
-        message += `\n`;
-      }
-
-      // Positive note
-      message += `**💡 Money-Saving Tips:**\n`;
-      message += `- Apply for Udyam Registration (free) to access MSME benefits\n`;
-      message += `- Many registrations can be done online without intermediaries\n`;
-      message += `- Prepare documents in advance to avoid delays\n`;
-      message += `- Check for state-specific subsidies for new businesses\n\n`;
-
-      message += `Would you like detailed steps for any specific compliance or help with cost planning?`;
+      const { message, totalCost, penaltyCount } = this.getBreakdown(compliances);
 
       return {
         message,
@@ -111,7 +76,7 @@ class CostRiskAgent {
         metadata: {
           total_cost: totalCost,
           compliance_count: compliances.length,
-          compliances_with_penalties: compliancesWithPenalties.length
+          compliances_with_penalties: penaltyCount
         }
       };
 
@@ -120,6 +85,74 @@ class CostRiskAgent {
       throw error;
     }
   }
+
+  /**
+   * Build the cost breakdown for a set of compliances, reusing a cached copy when available
+   */
+  private getBreakdown(compliances: ComplianceRule[]): CostBreakdown {
+    const cacheKey = compliances.map(c => c.id).join('|');
+    const cached = this.breakdownCache.get(cacheKey);
+    if (cached) {
+      return cached;
+    }
+
+    // Calculate total cost
+    const totalCost = ruleEngine.calculateTotalCost(compliances);
+    
+    // Build detailed cost breakdown
+    let message = `💰 **Cost & Fee Breakdown**\n\n`;
+    message += `Based on your business profile, here's the estimated cost breakdown:\n\n`;
+
+    // Detailed breakdown by compliance
+    message += `**📋 Compliance-wise Costs:**\n\n`;
+
+    compliances.forEach(comp => {
+      const minCost = comp.estimated_cost.min;
+      const maxCost = comp.estimated_cost.max;
+      const mandatory = comp.mandatory ? '✅ Mandatory' : '⭐ Recommended';
+      
+      message += `**${comp.name}** (${mandatory})\n`;
+      message += `- Cost: ${formatINR(minCost)}`;
+      if (minCost !== maxCost) {
+        message += ` - ${formatINR(maxCost)}`;
+      }
+      message += `\n`;
+      message += `- Timeline: ${comp.estimated_timeline}\n`;
+      
+      if (comp.penalty) {
+        message += `- ⚠️ Non-compliance penalty: ${comp.penalty}\n`;
+      }
+      
+      message += `\n`;
+    });
+
+    // Total summary
+    message += `---\n\n`;
+    message += `**📊 Total Estimated Costs:**\n`;
+    message += `- Minimum: ${formatINR(totalCost.min)}\n`;
+    message += `- Maximum: ${formatINR(totalCost.max)}\n\n`;
+
+    // Additional costs
+    message += ADDITIONAL_CONSIDERATIONS;
+
+    // Penalty summary
+    const compliancesWithPenalties = compliances.filter(c => c.penalty);
+    if (compliancesWithPenalties.length > 0) {
+      message += `**⚠️ Penalty Summary:**\n`;
+      message += `_Operating without proper compliances may result in:_\n`;
+      compliancesWithPenalties.forEach(comp => {
+        message += `- ${comp.name}: ${comp.penalty}\n`;
+      });
+      message += `\n`;
+    }
+
+    // Positive note
+    message += MONEY_SAVING_TIPS;
+
+    const breakdown = { message, totalCost, penaltyCount: compliancesWithPenalties.length };
+    this.breakdownCache.set(cacheKey, breakdown);
+    return breakdown;
+  }
 }
 
 export default new CostRiskAgent();
@@ -1,6 +1,7 @@
 import llmProvider from '../utils/llmProvider';
 import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
 import logger from '../utils/logger';
+import { formatProfileLines, formatRecentMessages } from '../utils/promptContext';
 
 /**
  * Discovery Agent - Collects business idea information
@@ -43,7 +44,7 @@ Provide responses that are warm, helpful, and focused on discovery.`;
         { temperature: 0.8, max_tokens: 500 }
       );
 
-      logger.info('Discovery Agent processed message', { userId: context.user_id });
+      logger.debug('Discovery Agent processed message', { userId: context.user_id });
 
       return {
         message: response.content,
@@ -60,29 +61,23 @@ Provide responses that are warm, helpful, and focused on discovery.`;
   }
 
   private buildPrompt(userMessage: string, context: ChatContext): string {
-    let prompt = `User Message: "${userMessage}"\n\n`;
+    let prompt = 'Respond to the user message at the end in a friendly, helpful way. Ask relevant follow-up questions to understand their business better.\n\n';
 
     // Add profile context if available
     if (context.business_profile) {
       prompt += 'What we know so far:\n';
-      const profile = context.business_profile;
-      if (profile.business_idea) prompt += `- Business Idea: ${profile.business_idea}\n`;
-      if (profile.business_type) prompt += `- Type: ${profile.business_type}\n`;
-      if (profile.state) prompt += `- Location: ${profile.city}, ${profile.state}\n`;
+      prompt += formatProfileLines(context.business_profile, ['business_idea', 'business_type', 'location']);
       prompt += '\n';
     }
 
     // Add recent conversation
     if (context.message_history.length > 0) {
-      const recentMessages = context.message_history.slice(-4);
       prompt += 'Recent conversation:\n';
-      recentMessages.forEach(msg => {
-        prompt += `${msg.role}: ${msg.content}\n`;
-      });
+      prompt += formatRecentMessages(context.message_history, 4);
       prompt += '\n';
     }
 
-    prompt += 'Respond to the user in a friendly, helpful way. Ask relevant follow-up questions to understand their business better.';
+    prompt += `User Message: "${userMessage}"`;
 
     return prompt;
   }
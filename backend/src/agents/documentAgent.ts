@@ -3,6 +3,90 @@ import ruleEngine from '../utils/ruleEngine';
 import { AgentResponse, AgentType, Intent, ChatContext, Document } from '../types';
 import { documentRepo } from '../database/repositories';
 import logger from '../utils/logger';
+import ResponseCache from '../utils/responseCache';
+import KeywordMatcher from '../utils/keywordMatcher';
+
+interface DocumentAnalysis {
+  document_type: string;
+  confidence: string;
+  extracted_info: any;
+  compliance_relevance: string[];
+  usage_notes: string;
+}
+
+// Phrases that signal the user is talking about a file they just uploaded
+const UPLOAD_PHRASES = new KeywordMatcher<boolean>([
+  ['uploaded', true],
+  ['this document', true]
+]);
+
+// File name tokens that identify common documents without needing the LLM.
+// `match` is the term looked up in each compliance's required documents;
+// `qualifiers` are extra words accepted only alongside that type's own key token.
+interface FileNameDocumentType {
+  document_type: string;
+  match: string;
+  qualifiers: ReadonlySet<string>;
+}
+
+const PAN_CARD: FileNameDocumentType = { document_type: 'PAN Card', match: 'pan card', qualifiers: new Set() };
+const AADHAAR_CARD: FileNameDocumentType = { document_type: 'Aadhaar Card', match: 'aadhaar', qualifiers: new Set() };
+const GST_CERTIFICATE: FileNameDocumentType = {
+  document_type: 'GST Certificate',
+  match: 'gst',
+  qualifiers: new Set(['certificate', 'registration'])
+};
+const FSSAI_LICENSE: FileNameDocumentType = {
+  document_type: 'FSSAI License',
+  match: 'fssai',
+  qualifiers: new Set(['license', 'licence', 'certificate', 'registration'])
+};
+const RENT_AGREEMENT: FileNameDocumentType = {
+  document_type: 'Rent Agreement',
+  match: 'rent agreement',
+  qualifiers: new Set(['agreement', 'deed'])
+};
+const BANK_STATEMENT: FileNameDocumentType = {
+  document_type: 'Bank Statement',
+  match: 'bank account statement',
+  qualifiers: new Set(['statement', 'account'])
+};
+
+const FILENAME_DOCUMENT_TYPES = new Map<string, FileNameDocumentType>([
+  ['pan', PAN_CARD],
+  ['aadhaar', AADHAAR_CARD],
+  ['aadhar', AADHAAR_CARD],
+  ['gst', GST_CERTIFICATE],
+  ['gstin', GST_CERTIFICATE],
+  ['fssai', FSSAI_LICENSE],
+  ['rent', RENT_AGREEMENT],
+  ['lease', RENT_AGREEMENT],
+  ['bank', BANK_STATEMENT],
+  ['passbook', BANK_STATEMENT]
+]);
+
+// Static tail blocks of the upload response, joined rather than re-appended per request
+const NO_RELEVANCE_BLOCK = `**Compliance Relevance:**
+This document may not be directly required for your current business setup, but keep it handy as it could be needed for:
+- Identity verification
+- Bank account opening
+- Future compliance requirements
+`;
+
+const UPLOAD_FOLLOWUP = 'Would you like to upload another document or know what else you need?';
+
+// Generic words that say nothing about what the document is ("pan_card_front_2.jpg")
+const FILENAME_FILLER_TOKENS = new Set(['card', 'copy', 'scan', 'scanned', 'front', 'back', 'doc', 'document', 'photo', 'image', 'img', 'page', 'my']);
+
+const FILE_EXTENSION = /\.[^.]+$/;
+const NAME_SEPARATORS = /[^a-z0-9]+/;
+const DIGITS_ONLY = /^\d+$/;
+
+const DOCUMENT_TIPS: readonly string[] = [
+  'Keep both digital and physical copies',
+  'Ensure document is not expired',
+  'Check for correct name spelling across documents'
+];
 
 /**
  * Document Agent (CRITICAL AGENT)
@@ -42,12 +126,18 @@ IMPORTANT:
 - Explain relevance to business compliance
 - Do not make assumptions about document validity`;
 
+  // Derived once so every query call sends a byte-identical system prefix
+  private readonly QUERY_SYSTEM_PROMPT = this.SYSTEM_PROMPT.replace('respond with JSON', 'respond conversationally');
+
+  // Identification depends only on file name and type, so repeat uploads skip the LLM
+  private analysisCache = new ResponseCache<DocumentAnalysis>(1000);
+  // Answers to document questions, keyed by the full prompt (requirements plus question)
+  private queryCache = new ResponseCache<string>(500);
+
   async process(userMessage: string, context: ChatContext, uploadedFile?: any): Promise<AgentResponse> {
     try {
       // Determine if this is upload or query
-      const isDocumentUpload = uploadedFile !== undefined || 
-        userMessage.toLowerCase().includes('uploaded') ||
-        userMessage.toLowerCase().includes('this document');
+      const isDocumentUpload = uploadedFile !== undefined || UPLOAD_PHRASES.hasMatch(userMessage);
 
       if (isDocumentUpload && uploadedFile) {
         return await this.handleDocumentUpload(uploadedFile, context);
@@ -65,7 +155,7 @@ IMPORTANT:
    * Handle document upload analysis
    */
   private async handleDocumentUpload(file: any, context: ChatContext): Promise<AgentResponse> {
-    logger.info('Processing document upload', { 
+    logger.debug('Processing document upload', { 
       userId: context.user_id,
       fileName: file.name 
     });
@@ -77,20 +167,26 @@ IMPORTANT:
       type: file.mimetype
     };
 
-    const prompt = `A user has uploaded a file:
+    // Lowercase the name once; both the cache key and the filename lookup use it
+    const lowerName = fileInfo.name.toLowerCase();
+    const cacheKey = `${lowerName}|${fileInfo.type}`;
+    let analysis = this.identifyFromFileName(lowerName, context) || this.analysisCache.get(cacheKey);
+
+    if (!analysis) {
+      const prompt = `Based on the filename and type, identify what kind of document the uploaded file below is and its relevance to business compliance. Respond with JSON only.
+
+Uploaded file:
 Name: ${fileInfo.name}
-Type: ${fileInfo.type}
-Size: ${fileInfo.size} bytes
+Type: ${fileInfo.type}`;
 
-Based on the filename and type, identify what kind of document this is and its relevance to business compliance. Respond with JSON only.`;
+      analysis = await llmProvider.generateJSON<DocumentAnalysis>(prompt, this.SYSTEM_PROMPT, { temperature: 0.3 });
 
-    const analysis = await llmProvider.generateJSON<{
-      document_type: string;
-      confidence: string;
-      extracted_info: any;
-      compliance_relevance: string[];
-      usage_notes: string;
-    }>(prompt, this.SYSTEM_PROMPT, { temperature: 0.3 });
+      // Validate before caching so a malformed answer is never served again
+      this.validateAnalysis(analysis);
+      this.analysisCache.set(cacheKey, analysis);
+    } else {
+      logger.debug('Document analysis served from cache', { fileName: fileInfo.name });
+    }
 
     // Get compliance details for relevant compliances
     const relevantCompliances = analysis.compliance_relevance
@@ -98,30 +194,22 @@ Based on the filename and type, identify what kind of document this is and its r
       .filter(Boolean);
 
     // Build response
-    let message = `📄 **Document Analysis**\n\n`;
-    message += `**File:** ${fileInfo.name}\n`;
-    message += `**Identified As:** ${analysis.document_type}\n`;
-    message += `**Confidence:** ${analysis.confidence}\n\n`;
-
-    if (analysis.compliance_relevance.length > 0) {
-      message += `**Compliance Relevance:**\n`;
-      message += `This document is needed for:\n`;
-      relevantCompliances.forEach(comp => {
-        if (comp) {
-          message += `- ✅ **${comp.name}** - ${comp.description.substring(0, 100)}...\n`;
-        }
-      });
-      message += `\n`;
-    } else {
-      message += `**Compliance Relevance:**\n`;
-      message += `This document may not be directly required for your current business setup, but keep it handy as it could be needed for:\n`;
-      message += `- Identity verification\n`;
-      message += `- Bank account opening\n`;
-      message += `- Future compliance requirements\n\n`;
-    }
+    const relevanceBlock = analysis.compliance_relevance.length > 0
+      ? `**Compliance Relevance:**
+This document is needed for:
+${relevantCompliances.map(comp => `- ✅ **${comp!.name}** - ${comp!.description.substring(0, 100)}...\n`).join('')}`
+      : NO_RELEVANCE_BLOCK;
+
+    const message = `📄 **Document Analysis**
 
-    message += `**Notes:** ${analysis.usage_notes}\n\n`;
-    message += `Would you like to upload another document or know what else you need?`;
+**File:** ${fileInfo.name}
+**Identified As:** ${analysis.document_type}
+**Confidence:** ${analysis.confidence}
+
+${relevanceBlock}
+**Notes:** ${analysis.usage_notes}
+
+${UPLOAD_FOLLOWUP}`;
 
     return {
       message,
@@ -136,11 +224,73 @@ Based on the filename and type, identify what kind of document this is and its r
     };
   }
 
+  /**
+   * Validate analysis structure
+   */
+  private validateAnalysis(analysis: any): void {
+    if (!analysis || typeof analysis.document_type !== 'string' || !analysis.document_type) {
+      throw new Error('Invalid analysis format from Document Agent');
+    }
+
+    if (!Array.isArray(analysis.compliance_relevance)) {
+      logger.warn('Missing compliance_relevance in document analysis, defaulting to none');
+      analysis.compliance_relevance = [];
+    }
+  }
+
+  /**
+   * Identify well-known documents from the (already lowercased) file name alone, skipping the LLM round-trip
+   */
+  private identifyFromFileName(lowerName: string, context: ChatContext): DocumentAnalysis | null {
+    const baseName = lowerName.replace(FILE_EXTENSION, '');
+
+    // Only trust the name when every meaningful token is the same document's key token
+    // or one of its qualifiers; anything else ("gst_invoice", "rent_receipt") is left to the LLM
+    let knownType: FileNameDocumentType | undefined;
+    const otherTokens: string[] = [];
+    for (const token of baseName.split(NAME_SEPARATORS)) {
+      if (!token || FILENAME_FILLER_TOKENS.has(token) || DIGITS_ONLY.test(token)) {
+        continue;
+      }
+
+      const tokenType = FILENAME_DOCUMENT_TYPES.get(token);
+      if (!tokenType) {
+        otherTokens.push(token);
+      } else if (knownType && knownType !== tokenType) {
+        return null;
+      } else {
+        knownType = tokenType;
+      }
+    }
+
+    if (!knownType || !otherTokens.every(token => knownType!.qualifiers.has(token))) {
+      return null;
+    }
+
+    let compliances = ruleEngine.getCompliancesRequiringDocument(knownType.match);
+
+    // Narrow to the user's own compliances when we know their business
+    if (context.business_profile) {
+      const applicableIds = new Set(
+        ruleEngine.getApplicableCompliances(context.business_profile).map(c => c.id)
+      );
+      compliances = compliances.filter(c => applicableIds.has(c.id));
+    }
+
+    return {
+      document_type: knownType.document_type,
+      confidence: 'medium',
+      extracted_info: {},
+      compliance_relevance: compliances.map(c => c.id),
+      usage_notes: `Identified from the file name. Make sure the name and details on your ${knownType.document_type} match your other registration documents.`
+    };
+  }
+
   /**
    * Handle queries about documents
    */
   private async handleDocumentQuery(userMessage: string, context: ChatContext): Promise<AgentResponse> {
-    logger.info('Processing document query', { userId: context.user_id });
+    logger.debug('Processing document query', { userId: context.user_id });
 
     // Get applicable compliances for document requirements
     const compliances = context.business_profile 
@@ -152,36 +302,42 @@ Based on the filename and type, identify what kind of document this is and its r
     
     compliances.forEach(comp => {
       comp.documents_required.forEach(doc => {
-        if (!documentMap.has(doc)) {
-          documentMap.set(doc, []);
+        const neededFor = documentMap.get(doc);
+        if (neededFor) {
+          neededFor.push(comp.name);
+        } else {
+          documentMap.set(doc, [comp.name]);
         }
-        documentMap.get(doc)!.push(comp.name);
       });
     });
+    const documentEntries = Array.from(documentMap.entries());
 
-    const prompt = `User Question: "${userMessage}"
-
+    const prompt = `Provide a helpful response about documents needed for business compliance. Be specific about what documents are needed and why.
 ${compliances.length > 0 ? `
 Documents Required for User's Business:
-${Array.from(documentMap.entries()).map(([doc, comps]) => 
+${documentEntries.map(([doc, comps]) => 
   `- ${doc}: needed for ${comps.join(', ')}`
 ).join('\n')}
 ` : ''}
-
-Provide a helpful response about documents needed for business compliance. Be specific about what documents are needed and why.`;
-
-    const response = await llmProvider.generateText(
-      prompt,
-      this.SYSTEM_PROMPT.replace('respond with JSON', 'respond conversationally'),
-      { temperature: 0.6, max_tokens: 800 }
-    );
+User Question: "${userMessage}"`;
+
+    let answer = this.queryCache.get(prompt);
+    if (answer === undefined) {
+      const response = await llmProvider.generateText(
+        prompt,
+        this.QUERY_SYSTEM_PROMPT,
+        { temperature: 0.6, max_tokens: 800 }
+      );
+      answer = response.content;
+      this.queryCache.set(prompt, answer);
+    }
 
     // If we have specific document requirements, add them
-    let message = response.content + '\n\n';
+    let message = answer + '\n\n';
 
     if (documentMap.size > 0) {
       message += `**📋 Quick Document Checklist:**\n`;
-      Array.from(documentMap.entries()).forEach(([doc, comps]) => {
+      documentEntries.forEach(([doc, comps]) => {
         message += `- [ ] ${doc} _(for ${comps.join(', ')})_\n`;
       });
       message += `\nWould you like to upload any of these documents for verification?`;
@@ -217,11 +373,7 @@ Provide a helpful response about documents needed for business compliance. Be sp
     return {
       required_for: requiredFor,
       importance: requiredFor.length > 0 ? 'Required' : 'Not currently required',
-      tips: [
-        'Keep both digital and physical copies',
-        'Ensure document is not expired',
-        'Check for correct name spelling across documents'
-      ]
+      tips: [...DOCUMENT_TIPS]
     };
   }
 }
@@ -1,18 +1,64 @@
 import llmProvider from '../utils/llmProvider';
 import { Intent, AgentType, MasterAgentDecision, ChatContext } from '../types';
 import logger from '../utils/logger';
+import ResponseCache from '../utils/responseCache';
+import { formatProfileLines, formatRecentMessages, ProfileField } from '../utils/promptContext';
 
-/**
- * Master Agent - The orchestrator of all worker agents
- * Responsibilities:
- * 1. Greet users (first message only)
- * 2. Detect intent from user message
- * 3. Analyze conversation context
- * 4. Route to appropriate worker agent
- * 5. Ensure safety (no hallucinated legal advice)
- */
-class MasterAgent {
-  private readonly SYSTEM_PROMPT = `You are the Master Agent of an AI-powered compliance and business setup chatbot for Indian MSMEs.
+// Single anchored, case-insensitive pattern covering every greeting prefix
+const GREETING_PATTERN = /^(?:hello|hi|hey|namaste|good (?:morning|afternoon|evening))/i;
+
+// Enum value lookups for validating LLM output, built once
+const VALID_INTENTS: ReadonlySet<string> = new Set<string>(Object.values(Intent));
+const VALID_AGENTS: ReadonlySet<string> = new Set<string>(Object.values(AgentType));
+
+// Shared, immutable routing decision used whenever classification fails
+const FALLBACK_DECISION: MasterAgentDecision = Object.freeze({
+  intent: Intent.UNKNOWN,
+  selected_agent: AgentType.DISCOVERY,
+  reasoning: 'Error in classification, defaulting to Discovery Agent',
+  context_summary: 'Error occurred'
+});
+
+// Short, context-free messages whose routing never depends on the conversation;
+// these are answered from the table instead of a classification call
+const shortDecision = (intent: Intent, reasoning: string): MasterAgentDecision => Object.freeze({
+  intent,
+  selected_agent: AgentType.DISCOVERY,
+  reasoning,
+  context_summary: 'Matched short message table'
+});
+const GREETING_DECISION = shortDecision(Intent.GREETING, 'Plain greeting');
+const ACKNOWLEDGEMENT_DECISION = shortDecision(Intent.GENERAL_CHAT, 'Plain acknowledgement');
+const SHORT_MESSAGE_DECISIONS: ReadonlyMap<string, MasterAgentDecision> = new Map([
+  ...['hi', 'hello', 'hey', 'namaste', 'good morning', 'good afternoon', 'good evening']
+    .map(msg => [msg, GREETING_DECISION] as const),
+  ...['thanks', 'thank you', 'thankyou', 'thx']
+    .map(msg => [msg, ACKNOWLEDGEMENT_DECISION] as const)
+]);
+// Longer messages can never be in the table, so they skip normalisation entirely
+const SHORT_MESSAGE_MAX_LENGTH = 24;
+const TRAILING_PUNCTUATION = /[\s!.?,]+$/;
+
+const CLASSIFY_INSTRUCTION = 'Based on the context below, classify the intent of the user message at the end and select the appropriate worker agent.';
+const MASTER_PROFILE_FIELDS: readonly ProfileField[] = ['business_name', 'business_type', 'location', 'sells_food', 'annual_turnover'];
+
+// Welcome text shown after the salutation; only the name varies per user
+const GREETING_BODY = `Welcome to your AI-powered business compliance assistant! I'm here to help you navigate the complexities of starting and running your business in India.
+
+I can help you with:
+✅ Understanding required licenses and compliances (GST, FSSAI, Trade License, etc.)
+📋 Document requirements and preparation
+🏪 Onboarding to platforms like Swiggy, Zomato, Amazon, Flipkart
+💰 Cost estimates and timeline planning
+📍 State and city-specific regulations
+
+**Important Disclaimer:** I provide guidance based on public information and is not a substitute for professional legal advice. Always consult with a qualified professional for your specific situation.
+
+To get started, tell me about your business idea or what you need help with!`;
+
+// Module-level so every classification call sends the same byte-identical
+// system prefix, which providers can serve from their prompt cache
+const SYSTEM_PROMPT = `You are the Master Agent of an AI-powered compliance and business setup chatbot for Indian MSMEs.
 
 Your responsibilities:
 1. Analyze user messages and classify their intent
@@ -61,31 +107,58 @@ CRITICAL RULES:
 - Be precise with intent classification
 - Provide clear reasoning for agent selection`;
 
+/**
+ * Master Agent - The orchestrator of all worker agents
+ * Responsibilities:
+ * 1. Greet users (first message only)
+ * 2. Detect intent from user message
+ * 3. Analyze conversation context
+ * 4. Route to appropriate worker agent
+ * 5. Ensure safety (no hallucinated legal advice)
+ */
+class MasterAgent {
+  // The prompt captures everything classification depends on, so identical prompts reuse the decision
+  private decisionCache = new ResponseCache<MasterAgentDecision>(512);
+
   /**
    * Process user message and determine routing
    */
   async processMessage(userMessage: string, context: ChatContext): Promise<MasterAgentDecision> {
     try {
+      // Exact short messages skip the LLM round trip entirely
+      const shortcut = this.matchShortMessage(userMessage);
+      if (shortcut) {
+        return shortcut;
+      }
+
       // Check if this is first message (greeting)
-      const isFirstMessage = context.message_history.filter(m => m.role === 'user').length === 0;
+      const isFirstMessage = !context.message_history.some(m => m.role === 'user');
 
       const prompt = this.buildPrompt(userMessage, context, isFirstMessage);
+      const cached = this.decisionCache.get(prompt);
+      if (cached) {
+        logger.debug('Master Agent decision cache hit', { userId: context.user_id });
+        return cached;
+      }
       
-      logger.info('Master Agent processing message', { 
-        userId: context.user_id,
-        messagePreview: userMessage.substring(0, 50)
-      });
+      if (logger.isDebugEnabled()) {
+        logger.debug('Master Agent processing message', {
+          userId: context.user_id,
+          messagePreview: userMessage.substring(0, 50)
+        });
+      }
 
       const decision = await llmProvider.generateJSON<MasterAgentDecision>(
         prompt,
-        this.SYSTEM_PROMPT,
+        SYSTEM_PROMPT,
         { temperature: 0.3, max_tokens: 500 }
       );
 
       // Validate decision
       this.validateDecision(decision);
+      this.decisionCache.set(prompt, Object.freeze(decision));
 
-      logger.info('Master Agent decision made', {
+      logger.debug('Master Agent decision made', {
         intent: decision.intent,
         agent: decision.selected_agent,
         userId: context.user_id
@@ -96,57 +169,53 @@ CRITICAL RULES:
     } catch (error: any) {
       logger.error('Master Agent error', { error: error.message });
       
-      // Fallback decision
-      return {
-        intent: Intent.UNKNOWN,
-        selected_agent: AgentType.DISCOVERY,
-        reasoning: 'Error in classification, defaulting to Discovery Agent',
-        context_summary: 'Error occurred'
-      };
+      return FALLBACK_DECISION;
     }
   }
 
+  /**
+   * Look up a short message in the decision table, ignoring case and trailing punctuation ("Hi!", "thanks.")
+   */
+  private matchShortMessage(userMessage: string): MasterAgentDecision | undefined {
+    if (userMessage.length > SHORT_MESSAGE_MAX_LENGTH) {
+      return undefined;
+    }
+
+    return SHORT_MESSAGE_DECISIONS.get(userMessage.toLowerCase().replace(TRAILING_PUNCTUATION, '').trim());
+  }
+
   /**
    * Build prompt with context
    */
   private buildPrompt(userMessage: string, context: ChatContext, isFirstMessage: boolean): string {
-    let prompt = `User Message: "${userMessage}"\n\n`;
+    // Sections are collected and joined once; empty sections are left out entirely
+    const sections: string[] = [CLASSIFY_INSTRUCTION];
 
     if (isFirstMessage) {
-      prompt += 'This is the user\'s first message in this conversation.\n\n';
+      sections.push('This is the user\'s first message in this conversation.');
     }
 
     // Add conversation history
     if (context.message_history.length > 0) {
-      prompt += 'Recent Conversation History:\n';
-      const recentMessages = context.message_history.slice(-5);
-      recentMessages.forEach(msg => {
-        prompt += `${msg.role}: ${msg.content.substring(0, 100)}\n`;
-      });
-      prompt += '\n';
+      sections.push(`Recent Conversation History:\n${formatRecentMessages(context.message_history, 5, 100)}`.trimEnd());
     }
 
-    // Add business profile context
+    // Add business profile context, skipping the heading when nothing is known yet
     if (context.business_profile) {
-      prompt += 'Business Profile:\n';
-      const profile = context.business_profile;
-      if (profile.business_name) prompt += `- Name: ${profile.business_name}\n`;
-      if (profile.business_type) prompt += `- Type: ${profile.business_type}\n`;
-      if (profile.state) prompt += `- Location: ${profile.city}, ${profile.state}\n`;
-      if (profile.sells_food) prompt += `- Sells Food: Yes\n`;
-      if (profile.annual_turnover) prompt += `- Turnover: ₹${profile.annual_turnover}\n`;
-      prompt += '\n';
+      const profileLines = formatProfileLines(context.business_profile, MASTER_PROFILE_FIELDS);
+      if (profileLines) {
+        sections.push(`Business Profile:\n${profileLines}`.trimEnd());
+      }
     }
 
     // Add last agent context
     if (context.last_agent_used) {
-      prompt += `Last Agent Used: ${context.last_agent_used}\n`;
-      prompt += `Last Intent: ${context.last_intent}\n\n`;
+      sections.push(`Last Agent Used: ${context.last_agent_used}\nLast Intent: ${context.last_intent}`);
     }
 
-    prompt += 'Based on the above context, classify the intent and select the appropriate worker agent.';
+    sections.push(`User Message: "${userMessage}"`);
 
-    return prompt;
+    return sections.join('\n\n');
   }
 
   /**
@@ -158,13 +227,13 @@ CRITICAL RULES:
     }
 
     // Validate intent is a valid enum value
-    if (!Object.values(Intent).includes(decision.intent)) {
+    if (!VALID_INTENTS.has(decision.intent)) {
       logger.warn(`Invalid intent: ${decision.intent}, defaulting to UNKNOWN`);
       decision.intent = Intent.UNKNOWN;
     }
 
     // Validate agent is a valid enum value
-    if (!Object.values(AgentType).includes(decision.selected_agent)) {
+    if (!VALID_AGENTS.has(decision.selected_agent)) {
       logger.warn(`Invalid agent: ${decision.selected_agent}, defaulting to DISCOVERY`);
       decision.selected_agent = AgentType.DISCOVERY;
     }
@@ -176,30 +245,16 @@ CRITICAL RULES:
   generateGreeting(userName?: string): string {
     const greeting = userName ? `Hello ${userName}!` : 'Hello!';
     
-    return `${greeting} 👋
-
-Welcome to your AI-powered business compliance assistant! I'm here to help you navigate the complexities of starting and running your business in India.
-
-I can help you with:
-✅ Understanding required licenses and compliances (GST, FSSAI, Trade License, etc.)
-📋 Document requirements and preparation
-🏪 Onboarding to platforms like Swiggy, Zomato, Amazon, Flipkart
-💰 Cost estimates and timeline planning
-📍 State and city-specific regulations
-
-**Important Disclaimer:** I provide guidance based on public information and is not a substitute for professional legal advice. Always consult with a qualified professional for your specific situation.
-
-To get started, tell me about your business idea or what you need help with!`;
+    return `${greeting} 👋\n\n${GREETING_BODY}`;
   }
 
   /**
    * Check if message is a greeting
    */
   isGreeting(message: string): boolean {
-    const greetingWords = ['hello', 'hi', 'hey', 'namaste', 'good morning', 'good afternoon', 'good evening'];
-    const lowerMessage = message.toLowerCase().trim();
-    
-    return greetingWords.some(word => lowerMessage.startsWith(word)) && lowerMessage.length < 50;
+    const trimmed = message.trim();
+
+    return trimmed.length < 50 && GREETING_PATTERN.test(trimmed);
   }
 }
 
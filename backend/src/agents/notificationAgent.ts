@@ -1,5 +1,49 @@
 import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
 import logger from '../utils/logger';
+import KeywordMatcher from '../utils/keywordMatcher';
+
+type NotificationAction = 'reminder' | 'deadlines';
+
+// Trigger words for each action; reminder requests take priority over deadline checks
+const ACTION_PRIORITY: Record<NotificationAction, number> = { reminder: 0, deadlines: 1 };
+const NOTIFICATION_KEYWORDS = new KeywordMatcher<NotificationAction>([
+  ['remind', 'reminder'],
+  ['notification', 'reminder'],
+  ['schedule', 'deadlines'],
+  ['deadline', 'deadlines']
+]);
+
+// Static menu shown when the message names no specific notification action
+const NOTIFICATION_OPTIONS_MESSAGE = `🔔 **Notification & Reminder Services**
+
+I can help you stay on top of your compliance deadlines!
+
+**Available Reminders:**
+1. 📅 **Filing Deadlines** - GST returns, annual filings
+2. 🔄 **License Renewals** - FSSAI, Trade License, etc.
+3. 💰 **Payment Reminders** - Tax payments, fee renewals
+4. 📝 **Document Expiry** - Track document validity
+
+**How to Set Up:**
+- Say "Remind me about GST filing"
+- Say "Show my upcoming deadlines"
+- Say "Set up monthly reminders"
+
+**Integration Options (Production):**
+- Email notifications
+- SMS alerts
+- WhatsApp messages
+- Calendar integration
+
+What would you like me to help you with?`;
+
+// Closing section of the deadline overview; settings are mocked and identical for all users
+const NOTIFICATION_SETTINGS = `**🔔 Notification Settings:**
+- Email reminders: ✅ Enabled
+- SMS alerts: ⚠️ Not configured
+- Push notifications: ✅ Enabled
+
+Would you like me to set up reminders for any specific deadline?`;
 
 /**
  * Notification Agent
@@ -18,18 +62,25 @@ class NotificationAgent {
     status: 'scheduled' | 'sent' | 'cancelled';
   }> = [];
 
+  // Action label to handler, so routing is a single lookup
+  private readonly actionHandlers: Record<
+    NotificationAction,
+    (userMessage: string, context: ChatContext) => AgentResponse
+  > = {
+    reminder: (userMessage, context) => this.handleReminderSetup(userMessage, context),
+    deadlines: (userMessage, context) => this.handleDeadlineCheck(context)
+  };
+
   async process(userMessage: string, context: ChatContext): Promise<AgentResponse> {
     try {
-      // Determine notification intent
-      const lowerMessage = userMessage.toLowerCase();
-      
-      if (lowerMessage.includes('remind') || lowerMessage.includes('notification')) {
-        return await this.handleReminderSetup(userMessage, context);
-      } else if (lowerMessage.includes('schedule') || lowerMessage.includes('deadline')) {
-        return await this.handleDeadlineCheck(context);
-      } else {
-        return await this.showNotificationOptions(context);
-      }
+      // Determine notification intent in a single scan of the message
+      // Handlers do no I/O, so they run synchronously inside this one async call
+      const action = this.detectAction(userMessage);
+      const handler = action ? this.actionHandlers[action] : undefined;
+
+      return handler
+        ? handler(userMessage, context)
+        : this.showNotificationOptions(context);
 
     } catch (error: any) {
       logger.error('Notification Agent error', { error: error.message });
@@ -37,11 +88,26 @@ class NotificationAgent {
     }
   }
 
+  /**
+   * Pick the highest-priority action whose trigger words appear in the message
+   */
+  private detectAction(userMessage: string): NotificationAction | null {
+    let action: NotificationAction | null = null;
+
+    for (const { value } of NOTIFICATION_KEYWORDS.findAll(userMessage)) {
+      if (action === null || ACTION_PRIORITY[value] < ACTION_PRIORITY[action]) {
+        action = value;
+      }
+    }
+
+    return action;
+  }
+
   /**
    * Set up a reminder
    */
-  private async handleReminderSetup(userMessage: string, context: ChatContext): Promise<AgentResponse> {
-    logger.info('Setting up reminder', { userId: context.user_id });
+  private handleReminderSetup(userMessage: string, context: ChatContext): AgentResponse {
+    logger.debug('Setting up reminder', { userId: context.user_id });
 
     // Mock implementation - in production, integrate with n8n/cron
     const reminder = {
@@ -95,8 +161,8 @@ Would you like to set up more reminders or customize notification preferences?`;
   /**
    * Check and display upcoming deadlines
    */
-  private async handleDeadlineCheck(context: ChatContext): Promise<AgentResponse> {
-    logger.info('Checking deadlines', { userId: context.user_id });
+  private handleDeadlineCheck(context: ChatContext): AgentResponse {
+    logger.debug('Checking deadlines', { userId: context.user_id });
 
     // Mock deadlines based on common compliance requirements
     const mockDeadlines = [
@@ -148,12 +214,7 @@ Would you like to set up more reminders or customize notification preferences?`;
       message += `\n`;
     }
 
-    message += `**🔔 Notification Settings:**\n`;
-    message += `- Email reminders: ✅ Enabled\n`;
-    message += `- SMS alerts: ⚠️ Not configured\n`;
-    message += `- Push notifications: ✅ Enabled\n\n`;
-
-    message += `Would you like me to set up reminders for any specific deadline?`;
+    message += NOTIFICATION_SETTINGS;
 
     return {
       message,
@@ -169,32 +230,9 @@ Would you like to set up more reminders or customize notification preferences?`;
   /**
    * Show notification options
    */
-  private async showNotificationOptions(context: ChatContext): Promise<AgentResponse> {
-    const message = `🔔 **Notification & Reminder Services**
-
-I can help you stay on top of your compliance deadlines!
-
-**Available Reminders:**
-1. 📅 **Filing Deadlines** - GST returns, annual filings
-2. 🔄 **License Renewals** - FSSAI, Trade License, etc.
-3. 💰 **Payment Reminders** - Tax payments, fee renewals
-4. 📝 **Document Expiry** - Track document validity
-
-**How to Set Up:**
-- Say "Remind me about GST filing"
-- Say "Show my upcoming deadlines"
-- Say "Set up monthly reminders"
-
-**Integration Options (Production):**
-- Email notifications
-- SMS alerts
-- WhatsApp messages
-- Calendar integration
-
-What would you like me to help you with?`;
-
+  private showNotificationOptions(context: ChatContext): AgentResponse {
     return {
-      message,
+      message: NOTIFICATION_OPTIONS_MESSAGE,
       agent_used: AgentType.NOTIFICATION,
       intent: Intent.STATUS_QUERY,
       requires_followup: true
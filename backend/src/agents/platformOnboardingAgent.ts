@@ -2,6 +2,19 @@ import ruleEngine from '../utils/ruleEngine';
 import llmProvider from '../utils/llmProvider';
 import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
 import logger from '../utils/logger';
+import { formatProfileLines } from '../utils/promptContext';
+import ResponseCache from '../utils/responseCache';
+
+// Lowercase search term to the capitalised name used in rule lookups and replies
+const PLATFORM_DISPLAY_NAMES: Map<string, string> = new Map([
+  ['swiggy', 'Swiggy'],
+  ['zomato', 'Zomato'],
+  ['amazon', 'Amazon'],
+  ['flipkart', 'Flipkart']
+]);
+
+// Any supported platform name, matched in one scan
+const PLATFORM_PATTERN = new RegExp(Array.from(PLATFORM_DISPLAY_NAMES.keys()).join('|'), 'i');
 
 /**
  * Platform Onboarding Agent
@@ -34,6 +47,9 @@ Structure your response:
 7. Timeline estimate
 8. Contact information`;
 
+  // Guidance depends only on the prompt inputs, so identical scenarios reuse the LLM answer
+  private guidanceCache = new ResponseCache<string>(500);
+
   async process(userMessage: string, context: ChatContext): Promise<AgentResponse> {
     try {
       const platformName = this.extractPlatformName(userMessage);
@@ -65,25 +81,41 @@ Structure your response:
         message: string;
       } | null = null;
       if (context.business_profile) {
-        eligibilityCheck = ruleEngine.checkPlatformEligibility(platformName, context.business_profile);
+        eligibilityCheck = ruleEngine.checkPlatformEligibility(platformName, context.business_profile, platformReq);
       }
 
-      const prompt = this.buildPrompt(platformName, platformReq, eligibilityCheck, context);
-      
-      const response = await llmProvider.generateText(
-        prompt,
-        this.SYSTEM_PROMPT,
-        { temperature: 0.5, max_tokens: 1200 }
-      );
+      // Key on exactly what buildPrompt reads, without rendering the prompt
+      const profile = context.business_profile;
+      const cacheKey = JSON.stringify([
+        platformName,
+        eligibilityCheck?.eligible,
+        eligibilityCheck?.missing_compliances,
+        profile?.business_name,
+        profile?.business_type,
+        profile?.state && `${profile.city}, ${profile.state}`
+      ]);
+
+      let guidance = this.guidanceCache.get(cacheKey);
+      if (guidance === undefined) {
+        const prompt = this.buildPrompt(platformName, platformReq, eligibilityCheck, context);
+        
+        const response = await llmProvider.generateText(
+          prompt,
+          this.SYSTEM_PROMPT,
+          { temperature: 0.5, max_tokens: 1200 }
+        );
+        guidance = response.content;
+        this.guidanceCache.set(cacheKey, guidance);
+      }
 
-      logger.info('Platform Onboarding Agent generated guidance', {
+      logger.debug('Platform Onboarding Agent generated guidance', {
         userId: context.user_id,
         platform: platformName,
         eligible: eligibilityCheck?.eligible
       });
 
       return {
-        message: response.content,
+        message: guidance,
         agent_used: AgentType.PLATFORM_ONBOARDING,
         intent: Intent.PLATFORM_QUERY,
         requires_followup: true,
@@ -101,10 +133,12 @@ Structure your response:
   }
 
   private buildPrompt(platformName: string, platformReq: any, eligibilityCheck: any, context: ChatContext): string {
-    let prompt = `Platform: ${platformName}\n\n`;
+    let prompt = `Provide comprehensive guidance for onboarding to the platform below. Include eligibility status, requirements, step-by-step process, costs, and timeline.\n\n`;
+
+    prompt += `Platform: ${platformName}\n\n`;
 
     prompt += `Official Platform Requirements:\n`;
-    prompt += JSON.stringify(platformReq, null, 2);
+    prompt += JSON.stringify(platformReq);
     prompt += `\n\n`;
 
     if (eligibilityCheck) {
@@ -118,29 +152,15 @@ Structure your response:
 
     if (context.business_profile) {
       prompt += `User's Business Profile:\n`;
-      const profile = context.business_profile;
-      if (profile.business_name) prompt += `- Name: ${profile.business_name}\n`;
-      if (profile.business_type) prompt += `- Type: ${profile.business_type}\n`;
-      if (profile.state) prompt += `- Location: ${profile.city}, ${profile.state}\n`;
-      prompt += `\n`;
+      prompt += formatProfileLines(context.business_profile, ['business_name', 'business_type', 'location']);
     }
 
-    prompt += `Provide comprehensive guidance for onboarding to ${platformName}. Include eligibility status, requirements, step-by-step process, costs, and timeline.`;
-
-    return prompt;
+    return prompt.trimEnd();
   }
 
   private extractPlatformName(message: string): string | null {
-    const lowerMessage = message.toLowerCase();
-    const platforms = ['swiggy', 'zomato', 'amazon', 'flipkart'];
-    
-    for (const platform of platforms) {
-      if (lowerMessage.includes(platform)) {
-        return platform.charAt(0).toUpperCase() + platform.slice(1);
-      }
-    }
-
-    return null;
+    const match = PLATFORM_PATTERN.exec(message);
+    return match ? PLATFORM_DISPLAY_NAMES.get(match[0].toLowerCase()) ?? null : null;
   }
 
   private listAvailablePlatforms(): string {
@@ -2,6 +2,22 @@ import { AgentResponse, AgentType, Intent, ChatContext, BusinessProfile } from '
 import { businessProfileRepo } from '../database/repositories';
 import llmProvider from '../utils/llmProvider';
 import logger from '../utils/logger';
+import { formatRecentMessages } from '../utils/promptContext';
+
+// Friendly prompts for profile fields the user still needs to provide
+const FIELD_LABELS: ReadonlyMap<string, string> = new Map([
+  ['business_name', 'Your business name'],
+  ['business_type', 'Type of business (e.g., Restaurant, Retail, Manufacturing)'],
+  ['state', 'Which state you operate in'],
+  ['city', 'Your city'],
+  ['annual_turnover', 'Expected annual turnover'],
+  ['employee_count', 'Number of employees'],
+  ['sells_food', 'Whether you sell food items'],
+  ['online_delivery', 'If you plan online delivery'],
+  ['has_physical_store', 'Whether you have a physical store'],
+  ['product_category', 'Product categories you deal with'],
+  ['target_platforms', 'Platforms you want to onboard (Swiggy, Amazon, etc.)']
+]);
 
 /**
  * Profile Builder Agent - Normalizes and structures business data
@@ -59,7 +75,7 @@ IMPORTANT:
         { temperature: 0.2, max_tokens: 800 }
       );
 
-      logger.info('Profile Builder extracted data', {
+      logger.debug('Profile Builder extracted data', {
         userId: context.user_id,
         fieldsExtracted: Object.keys(extraction.updates).length
       });
@@ -110,46 +126,29 @@ IMPORTANT:
   }
 
   private buildPrompt(userMessage: string, context: ChatContext): string {
-    let prompt = `User Message: "${userMessage}"\n\n`;
+    let prompt = 'Extract structured business information from the user message at the end and the recent conversation. Only extract information you are confident about.\n\n';
 
     // Add current profile context
     if (context.business_profile) {
       prompt += 'Current Business Profile:\n';
-      prompt += JSON.stringify(context.business_profile, null, 2);
+      prompt += JSON.stringify(context.business_profile);
       prompt += '\n\n';
     }
 
     // Add conversation history for context
     if (context.message_history.length > 0) {
-      const recentMessages = context.message_history.slice(-6);
       prompt += 'Recent conversation (for context):\n';
-      recentMessages.forEach(msg => {
-        prompt += `${msg.role}: ${msg.content.substring(0, 150)}\n`;
-      });
+      prompt += formatRecentMessages(context.message_history, 6, 150);
       prompt += '\n';
     }
 
-    prompt += 'Extract structured business information from the user message and recent conversation. Only extract information you are confident about.';
+    prompt += `User Message: "${userMessage}"`;
 
     return prompt;
   }
 
   private formatFieldName(field: string): string {
-    const fieldNames: Record<string, string> = {
-      'business_name': 'Your business name',
-      'business_type': 'Type of business (e.g., Restaurant, Retail, Manufacturing)',
-      'state': 'Which state you operate in',
-      'city': 'Your city',
-      'annual_turnover': 'Expected annual turnover',
-      'employee_count': 'Number of employees',
-      'sells_food': 'Whether you sell food items',
-      'online_delivery': 'If you plan online delivery',
-      'has_physical_store': 'Whether you have a physical store',
-      'product_category': 'Product categories you deal with',
-      'target_platforms': 'Platforms you want to onboard (Swiggy, Amazon, etc.)'
-    };
-
-    return fieldNames[field] || field;
+    return FIELD_LABELS.get(field) || field;
   }
 }
 
@@ -2,6 +2,16 @@ import ruleEngine from '../utils/ruleEngine';
 import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
 import { complianceResultRepo } from '../database/repositories';
 import logger from '../utils/logger';
+import { formatINR } from '../utils/format';
+
+// Closing section of every compliance analysis; identical for all users
+const NEXT_STEPS = `**What would you like to do next?**
+- Get detailed explanation of any compliance
+- See a week-by-week implementation timeline
+- Check platform onboarding requirements
+- Upload documents for verification
+
+*Disclaimer: This is guidance based on public information and is not legal advice.*`;
 
 /**
  * Rule Engine Interface Agent
@@ -24,7 +34,7 @@ class RuleEngineInterfaceAgent {
         };
       }
 
-      logger.info('Fetching applicable compliances', { 
+      logger.debug('Fetching applicable compliances', { 
         userId: context.user_id,
         profileId: context.business_profile.id 
       });
@@ -34,20 +44,23 @@ class RuleEngineInterfaceAgent {
       const mandatory = compliances.filter(c => c.mandatory);
       const optional = compliances.filter(c => !c.mandatory);
 
-      // Save to database
-      for (const compliance of compliances) {
-        await complianceResultRepo.saveComplianceResult({
-          business_profile_id: context.business_profile.id,
-          compliance_id: compliance.id,
-          compliance_name: compliance.name,
-          level: compliance.level,
-          is_mandatory: compliance.mandatory,
-          status: 'pending',
-          documents_required: compliance.documents_required,
-          estimated_cost: compliance.estimated_cost.max,
-          estimated_timeline: compliance.estimated_timeline,
-          authority: compliance.authority
-        });
+      // Save to database in a single round trip (nothing to insert when no compliances apply)
+      if (compliances.length > 0) {
+        const profileId = context.business_profile.id;
+        await complianceResultRepo.saveComplianceResults(
+          compliances.map(compliance => ({
+            business_profile_id: profileId,
+            compliance_id: compliance.id,
+            compliance_name: compliance.name,
+            level: compliance.level,
+            is_mandatory: compliance.mandatory,
+            status: 'pending' as const,
+            documents_required: compliance.documents_required,
+            estimated_cost: compliance.estimated_cost.max,
+            estimated_timeline: compliance.estimated_timeline,
+            authority: compliance.authority
+          }))
+        );
       }
 
       // Calculate total cost
@@ -64,7 +77,7 @@ class RuleEngineInterfaceAgent {
           message += `${idx + 1}. **${comp.name}**\n`;
           message += `   - Authority: ${comp.authority}\n`;
           message += `   - Timeline: ${comp.estimated_timeline}\n`;
-          message += `   - Cost: ₹${comp.estimated_cost.min} - ₹${comp.estimated_cost.max}\n`;
+          message += `   - Cost: ${formatINR(comp.estimated_cost.min)} - ${formatINR(comp.estimated_cost.max)}\n`;
           if (comp.penalty) {
             message += `   - ⚠️ Penalty for non-compliance: ${comp.penalty}\n`;
           }
@@ -82,16 +95,10 @@ class RuleEngineInterfaceAgent {
       }
 
       // Cost summary
-      message += `**💰 Total Estimated Cost:** ₹${costEstimate.min.toLocaleString('en-IN')} - ₹${costEstimate.max.toLocaleString('en-IN')}\n\n`;
+      message += `**💰 Total Estimated Cost:** ${formatINR(costEstimate.min)} - ${formatINR(costEstimate.max)}\n\n`;
 
       // Next steps
-      message += `**What would you like to do next?**\n`;
-      message += `- Get detailed explanation of any compliance\n`;
-      message += `- See a week-by-week implementation timeline\n`;
-      message += `- Check platform onboarding requirements\n`;
-      message += `- Upload documents for verification\n\n`;
-
-      message += `*Disclaimer: This is guidance based on public information and is not legal advice.*`;
+      message += NEXT_STEPS;
 
       return {
         message,
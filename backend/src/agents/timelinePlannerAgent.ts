@@ -2,6 +2,15 @@ import ruleEngine from '../utils/ruleEngine';
 import { AgentResponse, AgentType, Intent, ChatContext } from '../types';
 import logger from '../utils/logger';
 
+// Closing section of every timeline; identical for all users
+const TIMELINE_TIPS = `**💡 Pro Tips:**
+- Start with compliances that have dependencies (like FSSAI if you need it for food delivery platforms)
+- Gather all documents beforehand to speed up the process
+- Some registrations can be done simultaneously
+- Keep digital and physical copies of all certificates
+
+Would you like detailed guidance on any specific compliance?`;
+
 /**
  * Timeline Planner Agent
  * Responsibilities:
@@ -22,7 +31,7 @@ class TimelinePlannerAgent {
         };
       }
 
-      logger.info('Generating timeline', { 
+      logger.debug('Generating timeline', { 
         userId: context.user_id,
         profileId: context.business_profile.id 
       });
@@ -66,13 +75,7 @@ class TimelinePlannerAgent {
       message += `- Estimated Total Time: ${totalWeeks} weeks\n`;
       message += `- Can be optimized by working on independent compliances in parallel\n\n`;
 
-      message += `**💡 Pro Tips:**\n`;
-      message += `- Start with compliances that have dependencies (like FSSAI if you need it for food delivery platforms)\n`;
-      message += `- Gather all documents beforehand to speed up the process\n`;
-      message += `- Some registrations can be done simultaneously\n`;
-      message += `- Keep digital and physical copies of all certificates\n\n`;
-
-      message += `Would you like detailed guidance on any specific compliance?`;
+      message += TIMELINE_TIPS;
 
       return {
         message,
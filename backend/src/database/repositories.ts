@@ -333,6 +333,21 @@ export class ComplianceResultRepository {
     return data as ComplianceResult;
   }
 
+  async saveComplianceResults(results: Omit<ComplianceResult, 'id' | 'created_at' | 'updated_at'>[]): Promise<ComplianceResult[]> {
+    const db = requireSupabase();
+    const { data, error } = await db
+      .from('compliance_results')
+      .insert(results)
+      .select();
+
+    if (error) {
+      logger.error('Error saving compliance results', { error });
+      throw new Error('Failed to save compliance results');
+    }
+
+    return data as ComplianceResult[];
+  }
+
   async getComplianceResultsByProfile(profileId: string): Promise<ComplianceResult[]> {
     const db = requireSupabase();
     const { data, error } = await db
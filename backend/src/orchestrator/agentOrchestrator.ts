@@ -29,6 +29,37 @@ interface AgentState {
   error?: string;
 }
 
+// Fixed user-facing fallback and disclaimer text
+const NO_RESPONSE_MESSAGE = 'I apologize, but I encountered an issue processing your request. Could you please try again?';
+const ORCHESTRATION_ERROR_MESSAGE = 'I apologize, but something went wrong. Please try again or contact support if the issue persists.';
+const WORKER_ERROR_MESSAGE = 'I had trouble processing your request. Let me try a different approach. Could you rephrase your question?';
+const DISCLAIMER_FOOTER = '\n\n---\n*Disclaimer: This is guidance based on public information and is not a substitute for professional legal advice. Always consult with a qualified professional for your specific situation.*';
+
+// Intents whose responses get the legal disclaimer appended
+const COMPLIANCE_INTENTS: ReadonlySet<Intent> = new Set([
+  Intent.COMPLIANCE_QUERY,
+  Intent.COST_QUERY,
+  Intent.TIMELINE_QUERY,
+  Intent.PLATFORM_QUERY
+]);
+
+type WorkerHandler = (userMessage: string, context: ChatContext, uploadedFile?: any) => Promise<AgentResponse>;
+
+/**
+ * Worker agent dispatch table, built once instead of branching per message
+ */
+const WORKER_HANDLERS: Map<AgentType, WorkerHandler> = new Map<AgentType, WorkerHandler>([
+  [AgentType.DISCOVERY, (message, context) => discoveryAgent.process(message, context)],
+  [AgentType.PROFILE_BUILDER, (message, context) => profileBuilderAgent.process(message, context)],
+  [AgentType.RULE_ENGINE_INTERFACE, (message, context) => ruleEngineInterfaceAgent.process(message, context)],
+  [AgentType.COMPLIANCE_EXPLAINER, (message, context) => complianceExplainerAgent.process(message, context)],
+  [AgentType.TIMELINE_PLANNER, (message, context) => timelinePlannerAgent.process(message, context)],
+  [AgentType.PLATFORM_ONBOARDING, (message, context) => platformOnboardingAgent.process(message, context)],
+  [AgentType.COST_RISK, (message, context) => costRiskAgent.process(message, context)],
+  [AgentType.DOCUMENT, (message, context, uploadedFile) => documentAgent.process(message, context, uploadedFile)],
+  [AgentType.NOTIFICATION, (message, context) => notificationAgent.process(message, context)]
+]);
+
 /**
  * Agent Orchestrator - LangGraph-style state machine for agent routing
  * 
@@ -36,6 +67,9 @@ interface AgentState {
  * User Message → Master Agent → Worker Agent Selection → Execute Agent → Response
  */
 class AgentOrchestrator {
+  // Message writes still in flight per session, awaited before that session's context is read
+  private pendingWrites: Map<string, Promise<void>> = new Map();
+
   /**
    * Process a user message through the agent graph
    */
@@ -55,17 +89,27 @@ class AgentOrchestrator {
         isComplete: false
       };
 
-      logger.info('Starting agent orchestration', {
-        userId,
-        sessionId,
-        messagePreview: userMessage.substring(0, 50)
-      });
+      // Skip building the preview payload when debug logging is off
+      if (logger.isDebugEnabled()) {
+        logger.debug('Starting agent orchestration', {
+          userId,
+          sessionId,
+          messagePreview: userMessage.substring(0, 50)
+        });
+      }
 
-      // Step 1: Save user message to database
-      await this.saveUserMessage(state);
+      // Step 1: Save user message to database while the agents run; tracked right away
+      // so concurrent history reads for this session wait for it
+      const userMessageSaved = this.saveUserMessage(state);
+      this.trackWrite(sessionId, userMessageSaved);
 
       // Step 2: Check for first message greeting
-      const isFirstMessage = state.context.message_history.filter(m => m.role === 'user').length === 1;
+      // Count user turns without copying the history, stopping once past one
+      let userMessageCount = 0;
+      for (const m of state.context.message_history) {
+        if (m.role === 'user' && ++userMessageCount > 1) break;
+      }
+      const isFirstMessage = userMessageCount === 1;
       
       if (isFirstMessage && masterAgent.isGreeting(userMessage)) {
         const greeting = masterAgent.generateGreeting();
@@ -90,7 +134,7 @@ class AgentOrchestrator {
       // Step 5: Finalize and save response
       if (!state.response) {
         state.response = {
-          message: 'I apologize, but I encountered an issue processing your request. Could you please try again?',
+          message: NO_RESPONSE_MESSAGE,
           agent_used: AgentType.MASTER,
           intent: Intent.UNKNOWN
         };
@@ -101,8 +145,9 @@ class AgentOrchestrator {
         state.response.message = this.addDisclaimer(state.response.message);
       }
 
-      // Save assistant message to database
-      await this.saveAssistantMessage(state);
+      // Save assistant message after the user message, without holding up the reply
+      const completedState = state;
+      this.trackWrite(sessionId, userMessageSaved.then(() => this.saveAssistantMessage(completedState)));
 
       logger.info('Agent orchestration complete', {
         userId,
@@ -116,7 +161,7 @@ class AgentOrchestrator {
       logger.error('Agent orchestration error', { error: error.message, userId, sessionId });
       
       return {
-        message: 'I apologize, but something went wrong. Please try again or contact support if the issue persists.',
+        message: ORCHESTRATION_ERROR_MESSAGE,
         agent_used: AgentType.MASTER,
         intent: Intent.UNKNOWN
       };
@@ -127,15 +172,23 @@ class AgentOrchestrator {
    * Build context for the current conversation
    */
   private async buildContext(userId: string, sessionId: string): Promise<ChatContext> {
-    // Fetch message history
-    const messages = await messageRepo.getMessagesBySession(sessionId);
-    
-    // Fetch business profile
-    const businessProfile = await businessProfileRepo.getProfileByUserId(userId);
-
-    // Determine last agent and intent
-    const assistantMessages = messages.filter(m => m.role === 'assistant');
-    const lastMessage = assistantMessages[assistantMessages.length - 1];
+    // Make sure the previous turn's messages are persisted before reading history
+    await this.pendingWrites.get(sessionId);
+
+    // Fetch message history and business profile concurrently; they are independent
+    const [messages, businessProfile] = await Promise.all([
+      messageRepo.getMessagesBySession(sessionId),
+      businessProfileRepo.getProfileByUserId(userId)
+    ]);
+
+    // Determine last agent and intent by scanning back from the newest message
+    let lastMessage: Message | undefined;
+    for (let i = messages.length - 1; i >= 0; i--) {
+      if (messages[i].role === 'assistant') {
+        lastMessage = messages[i];
+        break;
+      }
+    }
 
     return {
       user_id: userId,
@@ -157,7 +210,7 @@ class AgentOrchestrator {
       state.intent = decision.intent;
       state.selectedAgent = decision.selected_agent;
 
-      logger.info('Master Agent decision', {
+      logger.debug('Master Agent decision', {
         intent: state.intent,
         agent: state.selectedAgent,
         reasoning: decision.reasoning
@@ -180,50 +233,10 @@ class AgentOrchestrator {
    */
   private async runWorkerAgent(state: AgentState, uploadedFile?: any): Promise<AgentState> {
     try {
-      const agent = state.selectedAgent;
-      let response: AgentResponse;
-
-      switch (agent) {
-        case AgentType.DISCOVERY:
-          response = await discoveryAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.PROFILE_BUILDER:
-          response = await profileBuilderAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.RULE_ENGINE_INTERFACE:
-          response = await ruleEngineInterfaceAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.COMPLIANCE_EXPLAINER:
-          response = await complianceExplainerAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.TIMELINE_PLANNER:
-          response = await timelinePlannerAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.PLATFORM_ONBOARDING:
-          response = await platformOnboardingAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.COST_RISK:
-          response = await costRiskAgent.process(state.userMessage, state.context);
-          break;
-
-        case AgentType.DOCUMENT:
-          response = await documentAgent.process(state.userMessage, state.context, uploadedFile);
-          break;
-
-        case AgentType.NOTIFICATION:
-          response = await notificationAgent.process(state.userMessage, state.context);
-          break;
-
-        default:
-          // Default to Discovery Agent for unknown cases
-          response = await discoveryAgent.process(state.userMessage, state.context);
-      }
+      // Default to Discovery Agent for unknown cases
+      const handler = (state.selectedAgent && WORKER_HANDLERS.get(state.selectedAgent))
+        || WORKER_HANDLERS.get(AgentType.DISCOVERY)!;
+      const response = await handler(state.userMessage, state.context, uploadedFile);
 
       state.response = response;
       state.isComplete = true;
@@ -234,7 +247,7 @@ class AgentOrchestrator {
       logger.error('Worker Agent failed', { error: error.message, agent: state.selectedAgent });
       
       state.response = {
-        message: 'I had trouble processing your request. Let me try a different approach. Could you rephrase your question?',
+        message: WORKER_ERROR_MESSAGE,
         agent_used: state.selectedAgent || AgentType.MASTER,
         intent: state.intent || Intent.UNKNOWN
       };
@@ -244,6 +257,18 @@ class AgentOrchestrator {
     }
   }
 
+  /**
+   * Remember an in-flight write for a session until it settles
+   */
+  private trackWrite(sessionId: string, write: Promise<void>): void {
+    this.pendingWrites.set(sessionId, write);
+    write.finally(() => {
+      if (this.pendingWrites.get(sessionId) === write) {
+        this.pendingWrites.delete(sessionId);
+      }
+    });
+  }
+
   /**
    * Save user message to database
    */
@@ -284,14 +309,7 @@ class AgentOrchestrator {
    * Check if intent is compliance-related
    */
   private isComplianceRelated(intent?: Intent): boolean {
-    const complianceIntents = [
-      Intent.COMPLIANCE_QUERY,
-      Intent.COST_QUERY,
-      Intent.TIMELINE_QUERY,
-      Intent.PLATFORM_QUERY
-    ];
-
-    return intent ? complianceIntents.includes(intent) : false;
+    return intent ? COMPLIANCE_INTENTS.has(intent) : false;
   }
 
   /**
@@ -302,7 +320,7 @@ class AgentOrchestrator {
       return message;
     }
 
-    return message + '\n\n---\n*Disclaimer: This is guidance based on public information and is not a substitute for professional legal advice. Always consult with a qualified professional for your specific situation.*';
+    return message + DISCLAIMER_FOOTER;
   }
 
   /**
@@ -333,6 +351,7 @@ class AgentOrchestrator {
    * Get conversation history for a session
    */
   async getConversationHistory(sessionId: string): Promise<Message[]> {
+    await this.pendingWrites.get(sessionId);
     return await messageRepo.getMessagesBySession(sessionId);
   }
 }
@@ -7,6 +7,25 @@ import logger from '../utils/logger';
 
 const router = Router();
 
+// Business-focused system prompt shared by the simple chat endpoints
+const SIMPLE_CHAT_SYSTEM_PROMPT = `You are a helpful AI assistant for Indian MSMEs (Micro, Small and Medium Enterprises). 
+You help with business registration, compliance requirements, platform onboarding (Amazon, Flipkart, Swiggy, Zomato, etc.), 
+and general business guidance. Provide practical, actionable advice specific to the Indian business landscape.
+
+Be conversational, helpful, and encourage users to take next steps. Use emojis sparingly for friendliness.
+
+Focus areas:
+- Business registration (MSME, GST, Shop & Establishment)
+- Required licenses (FSSAI for food, Trade License, etc.)
+- E-commerce platform onboarding
+- Document requirements
+- Compliance timelines
+- Cost estimates
+
+Always ask follow-up questions to better understand the user's business needs.`;
+
+const SIMPLE_CHAT_CONFIG = { temperature: 0.7, max_tokens: 800 };
+
 /**
  * POST /api/chat/simple
  * Simple chat endpoint without database - uses LLM directly
@@ -28,27 +47,10 @@ router.post(
 
     try {
       // For simple chat, just call LLM directly with business-focused system prompt
-      let systemPrompt = `You are a helpful AI assistant for Indian MSMEs (Micro, Small and Medium Enterprises). 
-You help with business registration, compliance requirements, platform onboarding (Amazon, Flipkart, Swiggy, Zomato, etc.), 
-and general business guidance. Provide practical, actionable advice specific to the Indian business landscape.
-
-Be conversational, helpful, and encourage users to take next steps. Use emojis sparingly for friendliness.
-
-Focus areas:
-- Business registration (MSME, GST, Shop & Establishment)
-- Required licenses (FSSAI for food, Trade License, etc.)
-- E-commerce platform onboarding
-- Document requirements
-- Compliance timelines
-- Cost estimates
-
-Always ask follow-up questions to better understand the user's business needs.`;
-
-      // Call LLM directly
       const llmResponse = await llmProvider.generateText(
         message,
-        systemPrompt,
-        { temperature: 0.7, max_tokens: 800 }
+        SIMPLE_CHAT_SYSTEM_PROMPT,
+        SIMPLE_CHAT_CONFIG
       );
 
       res.json({
@@ -73,6 +75,76 @@ Always ask follow-up questions to better understand the user's business needs.`;
   })
 );
 
+/**
+ * POST /api/chat/simple/stream
+ * Same as /simple, but streams tokens as server-sent events while they are generated
+ */
+router.post(
+  '/simple/stream',
+  asyncHandler(async (req: Request, res: Response) => {
+    const { message } = req.body;
+    const userId = req.headers['x-user-id'] as string || 'guest';
+
+    if (!message) {
+      return res.status(400).json({
+        success: false,
+        error: 'Message is required'
+      });
+    }
+
+    logger.info('Simple chat stream request received', { userId, messagePreview: message.substring(0, 50) });
+
+    res.setHeader('Content-Type', 'text/event-stream');
+    res.setHeader('Cache-Control', 'no-cache');
+    res.setHeader('Connection', 'keep-alive');
+    res.flushHeaders();
+
+    // Cancel the upstream LLM stream if the client goes away before we finish.
+    // Listen on the response: the request emits 'close' as soon as its body has been read
+    const abortController = new AbortController();
+    res.on('close', () => {
+      if (!res.writableEnded) {
+        abortController.abort();
+      }
+    });
+    const isClosed = () => res.writableEnded || res.destroyed || !!res.socket?.destroyed;
+    const send = (event: string) => {
+      if (!isClosed()) {
+        res.write(event);
+      }
+    };
+
+    try {
+      const llmResponse = await llmProvider.streamText(
+        message,
+        token => send(`data: ${JSON.stringify({ token })}\n\n`),
+        SIMPLE_CHAT_SYSTEM_PROMPT,
+        SIMPLE_CHAT_CONFIG,
+        abortController.signal
+      );
+
+      send(`event: done\ndata: ${JSON.stringify({
+        agent_used: 'master',
+        intent: 'GENERAL_CHAT',
+        provider: llmResponse.provider,
+        timestamp: new Date().toISOString()
+      })}\n\n`);
+
+    } catch (error: any) {
+      if (abortController.signal.aborted) {
+        logger.debug('Simple chat stream cancelled by client', { userId });
+      } else {
+        logger.error('Simple chat stream error:', error);
+        send(`event: error\ndata: ${JSON.stringify({ error: 'Failed to process message' })}\n\n`);
+      }
+    }
+
+    if (!isClosed()) {
+      res.end();
+    }
+  })
+);
+
 /**
  * POST /api/chat
  * Main chat endpoint - sends message to AI agent system
@@ -6,6 +6,10 @@ import logger from '../utils/logger';
 
 const router = Router();
 
+// Static system prompt so repeated test calls share a byte-identical prefix
+const TEST_LLM_SYSTEM_PROMPT = `You are a helpful AI assistant for Indian businesses. Provide clear, helpful advice about business registration, compliance, and growth opportunities.`;
+const TEST_LLM_CONFIG = { temperature: 0.7, max_tokens: 500 };
+
 /**
  * POST /api/debug/test-llm
  * Test LLM integration directly
@@ -16,12 +20,10 @@ router.post('/test-llm', asyncHandler(async (req: Request, res: Response) => {
   try {
     logger.info('Testing LLM with message:', message);
 
-    const systemPrompt = `You are a helpful AI assistant for Indian businesses. Provide clear, helpful advice about business registration, compliance, and growth opportunities.`;
-
     const response = await llmProvider.generateText(
       message,
-      systemPrompt,
-      { temperature: 0.7, max_tokens: 500 }
+      TEST_LLM_SYSTEM_PROMPT,
+      TEST_LLM_CONFIG
     );
 
     res.json({
@@ -1,6 +1,7 @@
 import { Router, Request, Response } from 'express';
 import path from 'path';
 import fs from 'fs';
+import { v4 as uuidv4 } from 'uuid';
 import { documentRepo, businessProfileRepo } from '../database/repositories';
 import { documentAgent } from '../agents';
 import agentOrchestrator from '../orchestrator/agentOrchestrator';
@@ -9,11 +10,21 @@ import logger from '../utils/logger';
 
 const router = Router();
 
-// Ensure upload directory exists
+// Ensure upload directory exists (recursive mkdir is a no-op when it already does)
 const uploadDir = process.env.UPLOAD_DIR || './uploads';
-if (!fs.existsSync(uploadDir)) {
-  fs.mkdirSync(uploadDir, { recursive: true });
-}
+fs.mkdirSync(uploadDir, { recursive: true });
+
+// Upload limits are fixed for the process lifetime, so resolve them once
+const MAX_FILE_SIZE = parseInt(process.env.MAX_FILE_SIZE || '10485760');
+const ALLOWED_MIME_TYPES = new Set(['application/pdf', 'image/jpeg', 'image/png', 'image/jpg']);
+
+// Common required documents, shared by every requirements check
+const COMMON_REQUIRED_DOCUMENTS = [
+  { type: 'PAN Card', required: true, description: 'Required for most registrations' },
+  { type: 'Aadhaar Card', required: true, description: 'Identity verification' },
+  { type: 'Address Proof', required: true, description: 'Business or personal address' },
+  { type: 'Bank Statement', required: true, description: 'Required for GST, platform onboarding' }
+];
 
 /**
  * POST /api/documents/upload
@@ -35,17 +46,15 @@ router.post(
     const file = req.files.document as any;
 
     // Validate file size
-    const maxSize = parseInt(process.env.MAX_FILE_SIZE || '10485760');
-    if (file.size > maxSize) {
+    if (file.size > MAX_FILE_SIZE) {
       return res.status(400).json({
         success: false,
-        error: `File size exceeds maximum of ${maxSize / 1024 / 1024}MB`
+        error: `File size exceeds maximum of ${MAX_FILE_SIZE / 1024 / 1024}MB`
       });
     }
 
     // Validate file type
-    const allowedTypes = ['application/pdf', 'image/jpeg', 'image/png', 'image/jpg'];
-    if (!allowedTypes.includes(file.mimetype)) {
+    if (!ALLOWED_MIME_TYPES.has(file.mimetype)) {
       return res.status(400).json({
         success: false,
         error: 'Invalid file type. Allowed: PDF, JPEG, PNG'
@@ -61,21 +70,10 @@ router.post(
       });
     }
 
-    // Generate unique filename
-    const timestamp = Date.now();
-    const fileName = `${userId}_${timestamp}_${file.name}`;
+    // Generate a collision-free stored filename; the original name is kept in the database
+    const fileName = `${uuidv4()}${path.extname(file.name).toLowerCase()}`;
     const filePath = path.join(uploadDir, fileName);
 
-    // Save file
-    await file.mv(filePath);
-
-    logger.info('Document uploaded', {
-      userId,
-      fileName: file.name,
-      size: file.size,
-      type: file.mimetype
-    });
-
     // Analyze document with Document Agent
     const context = {
       user_id: userId,
@@ -84,11 +82,22 @@ router.post(
       message_history: []
     };
 
-    const analysis = await documentAgent.process(
-      'I have uploaded a document',
-      context,
-      { name: file.name, size: file.size, mimetype: file.mimetype }
-    );
+    // Analysis only needs file metadata, so run it while the file is being saved
+    const [, analysis] = await Promise.all([
+      file.mv(filePath),
+      documentAgent.process(
+        'I have uploaded a document',
+        context,
+        { name: file.name, size: file.size, mimetype: file.mimetype }
+      )
+    ]);
+
+    logger.info('Document uploaded', {
+      userId,
+      fileName: file.name,
+      size: file.size,
+      type: file.mimetype
+    });
 
     // Save document to database
     const document = await documentRepo.createDocument({
@@ -183,7 +192,7 @@ router.get(
 
     // Get uploaded documents
     const uploadedDocs = await documentRepo.getDocumentsByUserId(userId);
-    const uploadedTypes = uploadedDocs.map(d => d.document_type);
+    const uploadedTypes = new Set(uploadedDocs.map(d => d.document_type));
 
     // Get required documents from profile context
     const profile = await businessProfileRepo.getProfileByUserId(userId);
@@ -197,20 +206,15 @@ router.get(
       });
     }
 
-    // Common required documents
-    const commonDocs = [
-      { type: 'PAN Card', required: true, description: 'Required for most registrations' },
-      { type: 'Aadhaar Card', required: true, description: 'Identity verification' },
-      { type: 'Address Proof', required: true, description: 'Business or personal address' },
-      { type: 'Bank Statement', required: true, description: 'Required for GST, platform onboarding' }
-    ];
-
     // Mark what's uploaded
-    const requirements = commonDocs.map(doc => ({
-      ...doc,
-      uploaded: uploadedTypes.includes(doc.type),
-      status: uploadedTypes.includes(doc.type) ? '✅ Uploaded' : '❌ Missing'
-    }));
+    const requirements = COMMON_REQUIRED_DOCUMENTS.map(doc => {
+      const uploaded = uploadedTypes.has(doc.type);
+      return {
+        ...doc,
+        uploaded,
+        status: uploaded ? '✅ Uploaded' : '❌ Missing'
+      };
+    });
 
     res.json({
       success: true,
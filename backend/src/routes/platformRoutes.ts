@@ -76,8 +76,8 @@ router.get(
       });
     }
 
-    const eligibility = ruleEngine.checkPlatformEligibility(name, profile);
     const platformReq = ruleEngine.getPlatformRequirements(name);
+    const eligibility = ruleEngine.checkPlatformEligibility(name, profile, platformReq);
 
     logger.info('Platform eligibility checked', {
       userId,
@@ -0,0 +1,13 @@
+/**
+ * Formatting helpers for user-facing messages
+ */
+
+// Building a formatter is expensive; toLocaleString creates one on every call
+const INR_NUMBER_FORMAT = new Intl.NumberFormat('en-IN');
+
+/**
+ * Format an amount in rupees with Indian digit grouping, e.g. ₹1,50,000
+ */
+export function formatINR(amount: number): string {
+  return `₹${INR_NUMBER_FORMAT.format(amount)}`;
+}
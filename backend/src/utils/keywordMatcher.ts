@@ -0,0 +1,128 @@
+/**
+ * Keyword Matcher - Aho-Corasick multi-keyword scanner
+ * Builds the automaton once so each message is scanned in a single pass,
+ * regardless of how many keywords are registered
+ */
+export interface KeywordMatch<T> {
+  keyword: string;
+  value: T;
+  index: number;
+}
+
+export class KeywordMatcher<T = string> {
+  private transitions: Array<Map<string, number>> = [new Map()];
+  private failure: number[] = [0];
+  private outputs: number[][] = [[]];
+  private keywords: Array<{ keyword: string; value: T }> = [];
+  // Texts shorter than this cannot contain any keyword, so they skip the scan
+  private minKeywordLength = Infinity;
+
+  /**
+   * @param entries keyword/value pairs; keywords are matched case-insensitively
+   */
+  constructor(entries: Array<[string, T]>) {
+    entries.forEach(([keyword, value]) => this.addKeyword(keyword.toLowerCase(), value));
+    this.buildFailureLinks();
+  }
+
+  private addKeyword(keyword: string, value: T): void {
+    let state = 0;
+
+    for (const char of keyword) {
+      let next = this.transitions[state].get(char);
+      if (next === undefined) {
+        next = this.transitions.length;
+        this.transitions.push(new Map());
+        this.failure.push(0);
+        this.outputs.push([]);
+        this.transitions[state].set(char, next);
+      }
+      state = next;
+    }
+
+    this.outputs[state].push(this.keywords.length);
+    this.keywords.push({ keyword, value });
+    this.minKeywordLength = Math.min(this.minKeywordLength, keyword.length);
+  }
+
+  /**
+   * Breadth-first pass to link each state to its longest proper suffix state
+   */
+  private buildFailureLinks(): void {
+    const queue: number[] = [];
+
+    this.transitions[0].forEach(child => queue.push(child));
+
+    while (queue.length > 0) {
+      const state = queue.shift()!;
+
+      this.transitions[state].forEach((child, char) => {
+        let fallback = this.failure[state];
+        while (fallback !== 0 && !this.transitions[fallback].has(char)) {
+          fallback = this.failure[fallback];
+        }
+
+        const target = this.transitions[fallback].get(char);
+        this.failure[child] = target !== undefined && target !== child ? target : 0;
+        this.outputs[child] = this.outputs[child].concat(this.outputs[this.failure[child]]);
+        queue.push(child);
+      });
+    }
+  }
+
+  /**
+   * Find every keyword occurrence in the text, in order of where it ends
+   */
+  findAll(text: string): KeywordMatch<T>[] {
+    const matches: KeywordMatch<T>[] = [];
+    if (text.length < this.minKeywordLength) {
+      return matches;
+    }
+
+    const lowerText = text.toLowerCase();
+    let state = 0;
+    let position = 0;
+
+    for (const char of lowerText) {
+      while (state !== 0 && !this.transitions[state].has(char)) {
+        state = this.failure[state];
+      }
+      state = this.transitions[state].get(char) ?? 0;
+      position += char.length;
+
+      for (const keywordIndex of this.outputs[state]) {
+        const { keyword, value } = this.keywords[keywordIndex];
+        matches.push({ keyword, value, index: position - keyword.length });
+      }
+    }
+
+    return matches;
+  }
+
+  /**
+   * Check whether any keyword occurs in the text
+   */
+  hasMatch(text: string): boolean {
+    if (text.length < this.minKeywordLength) {
+      return false;
+    }
+
+    const lowerText = text.toLowerCase();
+    let state = 0;
+
+    for (const char of lowerText) {
+      while (state !== 0 && !this.transitions[state].has(char)) {
+        state = this.failure[state];
+      }
+      state = this.transitions[state].get(char) ?? 0;
+
+      if (this.outputs[state].length > 0) {
+        return true;
+      }
+    }
+
+    return false;
+  }
+}
+
+export default KeywordMatcher;
@@ -1,7 +1,18 @@
 import axios from 'axios';
+import http from 'http';
+import https from 'https';
 import { LLMResponse, LLMConfig } from '../types';
 import logger from './logger';
 
+// Reuse TCP/TLS connections to the LLM providers across calls instead of handshaking every request
+const httpClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true }),
+  httpsAgent: new https.Agent({ keepAlive: true })
+});
+
+// Markdown code fences (``` or ```json) models sometimes wrap JSON output in
+const CODE_FENCE = /```(?:json)?\n?/g;
+
 /**
  * LLM Provider with automatic fallback from Grok to Ollama
  * Implements resilient LLM calling with error handling
@@ -13,6 +24,7 @@ class LLMProvider {
   private ollamaBaseUrl: string;
   private ollamaModel: string;
   private defaultConfig: LLMConfig;
+  private inFlight: Map<string, Promise<LLMResponse>> = new Map();
 
   constructor() {
     this.groqApiKey = process.env.GROQ_API_KEY || process.env.GROK_API_KEY || '';
@@ -40,11 +52,33 @@ class LLMProvider {
   ): Promise<LLMResponse> {
     const finalConfig = { ...this.defaultConfig, ...config };
 
+    // Identical concurrent requests share one provider call instead of each paying a round-trip
+    const requestKey = JSON.stringify([prompt, systemPrompt || '', finalConfig]);
+    const pending = this.inFlight.get(requestKey);
+    if (pending) {
+      logger.debug('Joining identical in-flight LLM request');
+      return pending;
+    }
+
+    const request = this.generateWithFallback(prompt, systemPrompt, finalConfig)
+      .finally(() => this.inFlight.delete(requestKey));
+    this.inFlight.set(requestKey, request);
+    return request;
+  }
+
+  /**
+   * Call Groq, falling back to Ollama if it fails
+   */
+  private async generateWithFallback(
+    prompt: string,
+    systemPrompt: string | undefined,
+    finalConfig: LLMConfig
+  ): Promise<LLMResponse> {
     // Try Groq first
     try {
-      logger.info('Attempting to call Groq API...');
+      logger.debug('Attempting to call Groq API...');
       const response = await this.callGroq(prompt, systemPrompt, finalConfig);
-      logger.info('Groq API call successful');
+      logger.debug('Groq API call successful');
       return response;
     } catch (groqError: any) {
       logger.warn(`Groq API failed: ${groqError.message}. Falling back to Ollama...`);
@@ -61,6 +95,63 @@ class LLMProvider {
     }
   }
 
+  /**
+   * Generate text and emit tokens as they arrive, with automatic fallback
+   * Resolves with the full response once the stream completes; aborting `signal` cancels the upstream request
+   */
+  async streamText(
+    prompt: string,
+    onToken: (token: string) => void,
+    systemPrompt?: string,
+    config?: Partial<LLMConfig>,
+    signal?: AbortSignal
+  ): Promise<LLMResponse> {
+    const finalConfig = { ...this.defaultConfig, ...config };
+    let hasEmitted = false;
+    const emit = (token: string) => {
+      hasEmitted = true;
+      onToken(token);
+    };
+
+    try {
+      logger.debug('Attempting to stream from Groq API...');
+      const response = await this.streamGroq(prompt, emit, systemPrompt, finalConfig, signal);
+      logger.debug('Groq API stream complete');
+      return response;
+    } catch (groqError: any) {
+      // A cancelled stream must not fall back to another provider
+      if (signal?.aborted) {
+        logger.debug('Groq stream cancelled by caller');
+        throw groqError;
+      }
+
+      // Tokens already sent to the client cannot be taken back
+      if (hasEmitted) {
+        logger.error(`Groq stream interrupted: ${groqError.message}`);
+        throw groqError;
+      }
+
+      logger.warn(`Groq API failed: ${groqError.message}. Falling back to Ollama...`);
+
+      try {
+        const response = await this.streamOllama(prompt, emit, systemPrompt, finalConfig, signal);
+        logger.info('Ollama fallback successful');
+        return response;
+      } catch (ollamaError: any) {
+        if (signal?.aborted) {
+          logger.debug('Ollama stream cancelled by caller');
+          throw ollamaError;
+        }
+        if (hasEmitted) {
+          logger.error(`Ollama stream interrupted: ${ollamaError.message}`);
+          throw ollamaError;
+        }
+        logger.error(`Both Groq and Ollama failed: ${ollamaError.message}`);
+        throw new Error('All LLM providers failed. Please check configuration.');
+      }
+    }
+  }
+
   /**
    * Call Groq API (Primary)
    */
@@ -79,7 +170,7 @@ class LLMProvider {
     }
     messages.push({ role: 'user', content: prompt });
 
-    const response = await axios.post(
+    const response = await httpClient.post(
       `${this.groqApiUrl}/chat/completions`,
       {
         model: this.groqModel,
@@ -105,6 +196,82 @@ class LLMProvider {
     };
   }
 
+  /**
+   * Stream from Groq API (Primary), parsing the OpenAI-style server-sent events
+   */
+  private async streamGroq(
+    prompt: string,
+    onToken: (token: string) => void,
+    systemPrompt?: string,
+    config?: LLMConfig,
+    signal?: AbortSignal
+  ): Promise<LLMResponse> {
+    if (!this.groqApiKey) {
+      throw new Error('Groq API key not configured');
+    }
+
+    const messages: any[] = [];
+    if (systemPrompt) {
+      messages.push({ role: 'system', content: systemPrompt });
+    }
+    messages.push({ role: 'user', content: prompt });
+
+    const response = await httpClient.post(
+      `${this.groqApiUrl}/chat/completions`,
+      {
+        model: this.groqModel,
+        messages,
+        temperature: config?.temperature || 0.7,
+        max_tokens: config?.max_tokens || 2000,
+        top_p: config?.top_p || 0.9,
+        stream: true
+      },
+      {
+        headers: {
+          'Authorization': `Bearer ${this.groqApiKey}`,
+          'Content-Type': 'application/json'
+        },
+        timeout: 30000,
+        responseType: 'stream',
+        signal
+      }
+    );
+
+    const stream = response.data;
+    stream.setEncoding('utf8');
+    // Stop reading (and being billed for) tokens as soon as the caller gives up
+    signal?.addEventListener('abort', () => stream.destroy(), { once: true });
+
+    let content = '';
+    let pending = '';
+
+    for await (const chunk of stream) {
+      pending += chunk;
+      const lines = pending.split('\n');
+      pending = lines.pop() || '';
+
+      for (const line of lines) {
+        const trimmed = line.trim();
+        if (!trimmed.startsWith('data:')) continue;
+
+        const payload = trimmed.slice('data:'.length).trim();
+        if (payload === '[DONE]') continue;
+
+        const token = JSON.parse(payload).choices?.[0]?.delta?.content;
+        if (token) {
+          content += token;
+          onToken(token);
+        }
+      }
+    }
+
+    return {
+      content,
+      provider: 'groq',
+      model: this.groqModel
+    };
+  }
+
   /**
    * Call Ollama API (Fallback)
    */
@@ -117,7 +284,7 @@ class LLMProvider {
       ? `${systemPrompt}\n\nUser: ${prompt}\n\nAssistant:`
       : prompt;
 
-    const response = await axios.post(
+    const response = await httpClient.post(
       `${this.ollamaBaseUrl}/api/generate`,
       {
         model: this.ollamaModel,
@@ -141,6 +308,72 @@ class LLMProvider {
     };
   }
 
+  /**
+   * Stream from Ollama API (Fallback), parsing its newline-delimited JSON chunks
+   */
+  private async streamOllama(
+    prompt: string,
+    onToken: (token: string) => void,
+    systemPrompt?: string,
+    config?: LLMConfig,
+    signal?: AbortSignal
+  ): Promise<LLMResponse> {
+    const fullPrompt = systemPrompt 
+      ? `${systemPrompt}\n\nUser: ${prompt}\n\nAssistant:`
+      : prompt;
+
+    const response = await httpClient.post(
+      `${this.ollamaBaseUrl}/api/generate`,
+      {
+        model: this.ollamaModel,
+        prompt: fullPrompt,
+        stream: true,
+        options: {
+          temperature: config?.temperature || 0.7,
+          num_predict: config?.max_tokens || 2000,
+          top_p: config?.top_p || 0.9
+        }
+      },
+      {
+        timeout: 60000,
+        responseType: 'stream',
+        signal
+      }
+    );
+
+    const stream = response.data;
+    stream.setEncoding('utf8');
+    signal?.addEventListener('abort', () => stream.destroy(), { once: true });
+
+    let content = '';
+    let pending = '';
+
+    const handleLine = (line: string) => {
+      const trimmed = line.trim();
+      if (!trimmed) return;
+
+      const token = JSON.parse(trimmed).response;
+      if (token) {
+        content += token;
+        onToken(token);
+      }
+    };
+
+    for await (const chunk of stream) {
+      pending += chunk;
+      const lines = pending.split('\n');
+      pending = lines.pop() || '';
+      lines.forEach(handleLine);
+    }
+    handleLine(pending);
+
+    return {
+      content,
+      provider: 'ollama',
+      model: this.ollamaModel
+    };
+  }
+
   /**
    * Generate structured JSON output
    */
@@ -158,7 +391,7 @@ class LLMProvider {
       let jsonText = response.content.trim();
       
       // Remove markdown code blocks if present
-      jsonText = jsonText.replace(/```json\n?/g, '').replace(/```\n?/g, '');
+      jsonText = jsonText.replace(CODE_FENCE, '');
       
       const parsed = JSON.parse(jsonText);
       return parsed as T;
@@ -184,7 +417,7 @@ class LLMProvider {
 
     // Check Ollama
     try {
-      await axios.get(`${this.ollamaBaseUrl}/api/tags`, { timeout: 5000 });
+      await httpClient.get(`${this.ollamaBaseUrl}/api/tags`, { timeout: 5000 });
       health.ollama = true;
     } catch (error) {
       health.ollama = false;
@@ -0,0 +1,46 @@
+import { BusinessProfile, Message } from '../types';
+import { formatINR } from './format';
+
+/**
+ * Prompt Context - shared renderers for the business profile and conversation
+ * history blocks that several agents include in their LLM prompts.
+ * Agents place these blocks after their static instructions and put the user
+ * message last, so consecutive prompts share the longest cacheable prefix.
+ */
+export type ProfileField = 'business_name' | 'business_idea' | 'business_type' | 'location' | 'annual_turnover' | 'sells_food';
+
+// One renderer per field; null means the field is unset and the line is skipped
+const PROFILE_LINE_RENDERERS: Record<ProfileField, (profile: BusinessProfile) => string | null> = {
+  business_name: p => (p.business_name ? `- Name: ${p.business_name}` : null),
+  business_idea: p => (p.business_idea ? `- Business Idea: ${p.business_idea}` : null),
+  business_type: p => (p.business_type ? `- Type: ${p.business_type}` : null),
+  location: p => (p.state ? `- Location: ${p.city ? `${p.city}, ` : ''}${p.state}` : null),
+  annual_turnover: p => (p.annual_turnover ? `- Turnover: ${formatINR(p.annual_turnover)}` : null),
+  sells_food: p => (p.sells_food ? '- Sells Food: Yes' : null)
+};
+
+/**
+ * Render the requested profile fields, in order, one "- Label: value" line each
+ */
+export function formatProfileLines(profile: BusinessProfile, fields: readonly ProfileField[]): string {
+  let lines = '';
+  for (const field of fields) {
+    const line = PROFILE_LINE_RENDERERS[field](profile);
+    if (line !== null) {
+      lines += `${line}\n`;
+    }
+  }
+  return lines;
+}
+
+/**
+ * Render the last `count` messages as "role: content" lines, optionally truncating each message
+ */
+export function formatRecentMessages(history: Message[], count: number, maxChars?: number): string {
+  let lines = '';
+  for (const msg of history.slice(-count)) {
+    const content = maxChars === undefined ? msg.content : msg.content.substring(0, maxChars);
+    lines += `${msg.role}: ${content}\n`;
+  }
+  return lines;
+}
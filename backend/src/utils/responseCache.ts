@@ -0,0 +1,62 @@
+/**
+ * Response Cache - In-process LRU cache with per-entry expiry
+ * Used by agents to short-circuit repeated LLM calls for identical scenarios
+ */
+export class ResponseCache<T> {
+  private entries: Map<string, { value: T; expiresAt: number }> = new Map();
+  private maxEntries: number;
+  private ttlMs: number;
+
+  constructor(maxEntries: number = 500, ttlMs: number = 60 * 60 * 1000) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+  }
+
+  /**
+   * Get a cached value, or undefined if missing or expired
+   */
+  get(key: string): T | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Re-insert to mark as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * Store a value, evicting the least recently used entry when full
+   */
+  set(key: string, value: T): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+
+    if (this.entries.size > this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.entries.delete(oldestKey);
+      }
+    }
+  }
+
+  /**
+   * Drop all cached entries
+   */
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
+
+export default ResponseCache;
@@ -2,6 +2,10 @@ import fs from 'fs';
 import path from 'path';
 import { ComplianceRule, RuleCondition, BusinessProfile } from '../types';
 import logger from './logger';
+import ResponseCache from './responseCache';
+
+// First number in an estimated timeline such as "7-15 days"
+const TIMELINE_DAYS = /(\d+)/;
 
 /**
  * Rule Engine - Deterministic compliance checking
@@ -12,6 +16,17 @@ class RuleEngine {
   private centralRules: ComplianceRule[] = [];
   private stateRules: Map<string, ComplianceRule[]> = new Map();
   private platformRules: any[] = [];
+  private platformsByName: Map<string, any> = new Map();
+
+  // Profile fields referenced by any rule condition; only these affect applicability
+  private conditionFields: string[] = [];
+  private applicableCache = new ResponseCache<ComplianceRule[]>(1000);
+  // Whole weeks each rule occupies in a timeline, derived once from its estimated_timeline
+  private ruleWeeks: WeakMap<ComplianceRule, number> = new WeakMap();
+  // Lowercased name/description/documents per rule (central first, then state) for keyword search
+  private searchIndex: Array<{ rule: ComplianceRule; name: string; description: string; documents: string[] }> = [];
+  // Document term to the rules requiring it; callers look up a small fixed set of terms
+  private documentCache = new ResponseCache<ComplianceRule[]>(200);
 
   constructor() {
     this.loadRules();
@@ -49,6 +64,23 @@ class RuleEngine {
       const platformPath = path.join(__dirname, '../rules/platforms/platformRequirements.json');
       this.platformRules = JSON.parse(fs.readFileSync(platformPath, 'utf-8'));
       logger.info(`Loaded ${this.platformRules.length} platform rules`);
+      this.platformsByName = new Map(
+        this.platformRules.map(p => [p.platform.toLowerCase(), p] as [string, any])
+      );
+
+      const fields = new Set<string>(['state']);
+      const allRules = [this.centralRules, ...this.stateRules.values()].flat();
+      allRules.forEach(rule => {
+        (rule.conditions || []).forEach(condition => fields.add(condition.field));
+        this.ruleWeeks.set(rule, this.estimateWeeks(rule));
+      });
+      this.conditionFields = Array.from(fields).sort();
+      this.searchIndex = allRules.map(rule => ({
+        rule,
+        name: rule.name.toLowerCase(),
+        description: rule.description.toLowerCase(),
+        documents: rule.documents_required.map(doc => doc.toLowerCase())
+      }));
 
     } catch (error: any) {
       logger.error('Failed to load rules', { error: error.message });
@@ -101,6 +133,15 @@ class RuleEngine {
    * Get all applicable compliances for a business profile
    */
   getApplicableCompliances(profile: BusinessProfile): ComplianceRule[] {
+    // Profiles that agree on every condition field share the same result
+    const cacheKey = this.conditionFields
+      .map(field => JSON.stringify((profile as any)[field]) ?? '')
+      .join('|');
+    const cached = this.applicableCache.get(cacheKey);
+    if (cached) {
+      return [...cached];
+    }
+
     const applicable: ComplianceRule[] = [];
 
     // Check central rules
@@ -122,12 +163,13 @@ class RuleEngine {
       }
     }
 
-    logger.info(`Found ${applicable.length} applicable compliances`, {
+    logger.debug(`Found ${applicable.length} applicable compliances`, {
       userId: profile.user_id,
       state: profile.state
     });
 
-    return applicable;
+    this.applicableCache.set(cacheKey, applicable);
+    return [...applicable];
   }
 
   /**
@@ -163,24 +205,43 @@ class RuleEngine {
     return undefined;
   }
 
+  /**
+   * Get all compliances (central and state) whose required documents mention the given term
+   */
+  getCompliancesRequiringDocument(documentTerm: string): ComplianceRule[] {
+    const lowerTerm = documentTerm.toLowerCase();
+    let matches = this.documentCache.get(lowerTerm);
+
+    if (!matches) {
+      matches = this.searchIndex
+        .filter(entry => entry.documents.some(doc => doc.includes(lowerTerm)))
+        .map(entry => entry.rule);
+      this.documentCache.set(lowerTerm, matches);
+    }
+
+    return [...matches];
+  }
+
   /**
    * Get platform requirements
    */
   getPlatformRequirements(platformName: string): any {
-    return this.platformRules.find(
-      p => p.platform.toLowerCase() === platformName.toLowerCase()
-    );
+    return this.platformsByName.get(platformName.toLowerCase());
   }
 
   /**
    * Check platform eligibility based on compliances
+   * Callers that already hold the platform requirements can pass them to skip the lookup
    */
-  checkPlatformEligibility(platformName: string, profile: BusinessProfile): {
+  checkPlatformEligibility(
+    platformName: string,
+    profile: BusinessProfile,
+    platform: any = this.getPlatformRequirements(platformName)
+  ): {
     eligible: boolean;
     missing_compliances: string[];
     message: string;
   } {
-    const platform = this.getPlatformRequirements(platformName);
     
     if (!platform) {
       return {
@@ -191,11 +252,11 @@ class RuleEngine {
     }
 
     const applicableCompliances = this.getApplicableCompliances(profile);
-    const complianceIds = applicableCompliances.map(c => c.id);
+    const complianceIds = new Set(applicableCompliances.map(c => c.id));
     
     const mandatoryCompliances = platform.requirements.mandatory_compliance || [];
     const missingCompliances = mandatoryCompliances.filter(
-      (req: string) => !complianceIds.includes(req)
+      (req: string) => !complianceIds.has(req)
     );
 
     const eligible = missingCompliances.length === 0;
@@ -253,15 +314,22 @@ class RuleEngine {
         actions: compliance.steps || []
       });
       
-      // Estimate weeks based on timeline
-      const timelineMatch = compliance.estimated_timeline.match(/(\d+)/);
-      const days = timelineMatch ? parseInt(timelineMatch[0]) : 7;
-      currentWeek += Math.ceil(days / 7);
+      currentWeek += this.ruleWeeks.get(compliance) ?? this.estimateWeeks(compliance);
     });
 
     return timeline;
   }
 
+  /**
+   * Estimate whole weeks from a rule's timeline text (defaults to 7 days)
+   */
+  private estimateWeeks(rule: ComplianceRule): number {
+    const timelineMatch = rule.estimated_timeline.match(TIMELINE_DAYS);
+    const days = timelineMatch ? parseInt(timelineMatch[0], 10) : 7;
+    // Integer ceiling division by 7
+    return Math.floor((days + 6) / 7);
+  }
+
   /**
    * Reload rules (useful for updates without restart)
    */
@@ -270,6 +338,8 @@ class RuleEngine {
     this.centralRules = [];
     this.stateRules.clear();
     this.platformRules = [];
+    this.applicableCache.clear();
+    this.documentCache.clear();
     this.loadRules();
   }
 
@@ -284,32 +354,11 @@ class RuleEngine {
    * Search rules by keyword
    */
   searchRules(keyword: string): ComplianceRule[] {
-    const results: ComplianceRule[] = [];
     const lowerKeyword = keyword.toLowerCase();
 
-    // Search central rules
-    this.centralRules.forEach(rule => {
-      if (
-        rule.name.toLowerCase().includes(lowerKeyword) ||
-        rule.description.toLowerCase().includes(lowerKeyword)
-      ) {
-        results.push(rule);
-      }
-    });
-
-    // Search state rules
-    for (const [, rules] of this.stateRules) {
-      rules.forEach(rule => {
-        if (
-          rule.name.toLowerCase().includes(lowerKeyword) ||
-          rule.description.toLowerCase().includes(lowerKeyword)
-        ) {
-          results.push(rule);
-        }
-      });
-    }
-
-    return results;
+    return this.searchIndex
+      .filter(entry => entry.name.includes(lowerKeyword) || entry.description.includes(lowerKeyword))
+      .map(entry => entry.rule);
   }
 }
 